@@ -24,6 +24,15 @@ class Card(ABC):
     specific card behaviors through the play() method.
     """
 
+    # Fixed attribute layout; subclasses declare their own extra slots
+    __slots__ = ("name", "description", "card_type")
+
+    # Registry ID of the card, set by @register_card
+    card_id: Optional[str] = None
+
+    # Damage dealt by the card, or None for cards that don't deal damage
+    damage: Optional[int] = None
+
     def __init__(self, name: str, description: str, card_type: CardType):
         """
         Initialize a card.
@@ -57,6 +66,8 @@ class BasicAttack(Card):
     to the target when played.
     """
 
+    __slots__ = ("damage",)
+
     def __init__(self, name: str, description: str, damage: int):
         """
         Initialize a basic attack card.
@@ -85,6 +96,8 @@ class BasicAttack(Card):
 class KineticBattleRifle(BasicAttack):
     """Kinetic Battle Rifle - deals 3 damage."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize Kinetic Battle Rifle card."""
         super().__init__(
@@ -98,6 +111,8 @@ class KineticBattleRifle(BasicAttack):
 class KineticSidearm(BasicAttack):
     """Kinetic Sidearm - deals 2 damage."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize Kinetic Sidearm card."""
         super().__init__(
@@ -111,6 +126,8 @@ class KineticSidearm(BasicAttack):
 class Knife(BasicAttack):
     """Knife - deals 1 damage."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize Knife card."""
         super().__init__(
@@ -122,6 +139,9 @@ class Knife(BasicAttack):
 
 class HealCard(Card):
     """Base class for cards that restore health."""
+
+    __slots__ = ("heal_amount",)
+
     def __init__(self, name: str, description: str, heal_amount: int):
         super().__init__(name, description, CardType.HEAL)
         self.heal_amount = heal_amount
@@ -134,6 +154,9 @@ class HealCard(Card):
 @register_card("med_patch")
 class MedPatch(HealCard):
     """A basic first aid patch that restores 2 HP."""
+
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="Med Patch",
@@ -150,6 +173,8 @@ class BasicDefense(Card):
     Their defense_value reduces the incoming damage.
     """
 
+    __slots__ = ("defense_value",)
+
     def __init__(self, name: str, description: str, defense_value: int):
         """
         Initialize a defense card.
@@ -175,6 +200,8 @@ class BasicDefense(Card):
 class EnergyShield(BasicDefense):
     """Energy Shield - blocks 2 damage."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize Energy Shield card."""
         super().__init__(
@@ -3,6 +3,7 @@
 import pygame
 from typing import Optional
 from card_game.card_registry import get_all_card_ids, get_card_info
+from shared.fonts import get_font
 
 
 class CardBookshelf:
@@ -20,8 +21,8 @@ class CardBookshelf:
             screen: Pygame surface for rendering
         """
         self.screen = screen
-        self.font = pygame.font.Font(None, 48)
-        self.card_font = pygame.font.Font(None, 24)
+        self.font = get_font(48)
+        self.card_font = get_font(24)
 
         # Load all card metadata
         self.card_ids = get_all_card_ids()
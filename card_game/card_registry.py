@@ -25,8 +25,9 @@ def register_card(card_id: str) -> Callable:
             ...
     """
     def decorator(card_class: Type['Card']) -> Type['Card']:
-        """Register the card class and return it unchanged."""
+        """Register the card class and record its ID on it."""
         CARD_REGISTRY[card_id] = card_class
+        card_class.card_id = card_id
         return card_class
     return decorator
 
@@ -44,10 +45,10 @@ def create_card(card_id: str) -> 'Card':
     Raises:
         ValueError: If card_id is not registered
     """
-    if card_id not in CARD_REGISTRY:
+    card_class = CARD_REGISTRY.get(card_id)
+    if card_class is None:
         raise ValueError(f"Card ID '{card_id}' not found in registry. Available cards: {list(CARD_REGISTRY.keys())}")
 
-    card_class = CARD_REGISTRY[card_id]
     return card_class()
 
 
@@ -88,7 +89,7 @@ def get_card_info(card_id: str) -> dict[str, Any]:
     }
 
     # Add damage if it's an attack card
-    if hasattr(card, 'damage'):
+    if card.damage is not None:
         info["damage"] = card.damage
 
     return info
@@ -7,6 +7,7 @@ from game_context import GameContext
 from card_game.player import Player
 from card_game.deck_factory import create_starter_deck, create_intro_enemy_deck, create_chapter_boss_deck, create_grinder_enemy_deck, create_test_small_deck
 from card_game.card import Card, CardType
+from shared.fonts import get_font
 
 
 class CombatState(Enum):
@@ -26,6 +27,17 @@ class CombatState(Enum):
     DEFEAT = "defeat"
 
 
+# Action button text that overrides the default label in specific combat states
+BUTTON_STATE_TEXT = {
+    CombatState.ENEMY_THINKING: "Enemy Turn",
+    CombatState.ENEMY_CARD_ANIMATING: "Enemy Turn",
+    CombatState.ENEMY_DISCARD_ANIMATING: "Enemy Turn",
+    CombatState.VICTORY: "Combat Over",
+    CombatState.DEFEAT: "Combat Over",
+    CombatState.PLAYER_DISCARDING: "Discarding",
+}
+
+
 class CardAnimation:
     """Represents a card animation from one position to another."""
 
@@ -95,8 +107,13 @@ class CardCombat:
             is_gatekeeper: Whether this is a gatekeeper battle
         """
         self.screen = screen
-        self.font = pygame.font.Font(None, 48)
-        self.card_font = pygame.font.Font(None, 24)
+        self.font = get_font(48)
+        self.card_font = get_font(24)
+        self._warning_font = get_font(64)
+        self._title_font = get_font(72)
+        self._prompt_font = get_font(56)
+        self._recompute_layout()
+        self._build_overlays()
 
         # Grab context
         self.game_context = game_context
@@ -130,6 +147,7 @@ class CardCombat:
 
         # Track hovered card and draw button
         self.hovered_card_index = None
+        self._last_hand_key = None  # Inputs of the last hand hover check
         self.draw_button_hovered = False
         self.pass_button_hovered = False
         self.discard_button_hovered = False
@@ -182,6 +200,22 @@ class CardCombat:
         self.counter_card_index = None
         self.skip_counter_hovered = False
 
+        # Rendered HUD text surfaces, keyed by slot -> (last value, surface)
+        self._hud_text_cache = {}
+
+        # Pre-rendered static deck faces, keyed by (label, colors, size)
+        self._deck_surface_cache = {}
+
+        # Pre-rendered action button variants, keyed by (text, color, size)
+        self._button_surface_cache = {}
+
+        # Pre-rendered card faces, keyed by card content and highlight style
+        self._card_surface_cache = {}
+
+        # Dirty-frame tracking: render() is skipped while nothing has changed
+        self._dirty = True
+        self._last_mouse_pos = None
+
     def _initialize_enemy_deck(self, enemy_deck: str) -> None:
         """
         Initialize enemy deck based on deck identifier.
@@ -217,7 +251,15 @@ class CardCombat:
         Returns:
             Action string for state transitions ('menu', etc.) or None
         """
+        if events:
+            # Any input may change what is on screen
+            self._dirty = True
+
         for event in events:
+            if event.type == pygame.VIDEORESIZE:
+                self._recompute_layout()
+                self._build_overlays()
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     # Toggle exit confirmation modal
@@ -262,7 +304,7 @@ class CardCombat:
 
     def _handle_resolve_click(self, pos: Tuple[int, int]) -> None:
         """Handle clicks during resolve state."""
-        layout = self._get_card_layout()
+        layout = self._layout
         card_width = layout['card_width']
         card_height = layout['card_height']
         staging_x = (self.screen.get_width() - card_width) // 2
@@ -283,7 +325,7 @@ class CardCombat:
 
     def _handle_counter_click(self, pos: Tuple[int, int]) -> None:
         """Handle clicks during counter selection."""
-        layout = self._get_card_layout()
+        layout = self._layout
 
         # Check if skip button was clicked
         skip_button_rect = self._get_skip_counter_button_rect(layout)
@@ -313,7 +355,7 @@ class CardCombat:
 
     def _start_counter_animation(self) -> None:
         """Start animation for the counter card moving to staging area."""
-        layout = self._get_card_layout()
+        layout = self._layout
         card_width = layout['card_width']
         card_height = layout['card_height']
 
@@ -366,10 +408,10 @@ class CardCombat:
             card = self.player.hand[self.hovered_card_index]
             if self.last_stand_active:
                 # In Last Stand, only Heal cards are playable
-                if hasattr(card, 'card_type') and card.card_type.value == 'heal':
+                if card.card_type == CardType.HEAL:
                     self._start_card_animation(self.hovered_card_index)
             else:
-                if hasattr(card, 'card_type') and card.card_type.value in ['attack', 'heal']:
+                if card.card_type in (CardType.ATTACK, CardType.HEAL):
                     self._start_card_animation(self.hovered_card_index)
 
     def _handle_discard_click(self, pos: Tuple[int, int]) -> None:
@@ -460,7 +502,7 @@ class CardCombat:
             return
 
         # Determine end position (original hand position)
-        layout = self._get_card_layout()
+        layout = self._layout
         card_width = layout['card_width']
         gap = layout['gap']
         
@@ -599,7 +641,7 @@ class CardCombat:
         score = 0.0
         
         if card.card_type == CardType.ATTACK:
-            score = float(getattr(card, 'damage', 0))
+            score = float(card.damage)
             
             # Persona modifiers
             if self.ai_persona == "aggressive":
@@ -728,7 +770,7 @@ class CardCombat:
         if self.player.is_defeated():
             # Check for heals in hand
             has_heals = any(
-                hasattr(card, 'card_type') and card.card_type.value == 'heal'
+                card.card_type == CardType.HEAL
                 for card in self.player.hand
             )
 
@@ -823,6 +865,8 @@ class CardCombat:
         Args:
             dt: Delta time in seconds
         """
+        previous_state = self.state
+
         match self.state:
             case CombatState.ENEMY_THINKING:
                 self.enemy_think_timer += dt
@@ -841,6 +885,9 @@ class CardCombat:
                 # Other states don't need update logic
                 pass
 
+        if self.state != previous_state or self.active_animations:
+            self._dirty = True
+
     def _update_animations(self, dt: float) -> None:
         """Update active animations and handle completion transitions."""
         for animation in self.active_animations[:]:
@@ -886,8 +933,12 @@ class CardCombat:
         """Check if the player can currently take actions."""
         return self.state == CombatState.PLAYER_TURN
 
-    def _get_card_layout(self) -> dict:
-        """Get common card layout dimensions used across render methods."""
+    def _recompute_layout(self) -> None:
+        """Compute common card layout dimensions used across render methods.
+
+        The layout only depends on the screen size, so it is cached in
+        self._layout and only recomputed when the window is resized.
+        """
         hand_size = 5
         card_width = 150
         card_height = 200
@@ -897,7 +948,7 @@ class CardCombat:
         start_x = (self.screen.get_width() - total_width) // 2
         card_y = self.screen.get_height() - card_height - 30
 
-        return {
+        self._layout = {
             'hand_size': hand_size,
             'card_width': card_width,
             'card_height': card_height,
@@ -908,41 +959,79 @@ class CardCombat:
             'card_y': card_y,
         }
 
+        # Hover hit boxes for each hand slot
+        self._hand_hit_rects = [
+            pygame.Rect(start_x + (i * (card_width + gap)), card_y, card_width, card_height)
+            for i in range(hand_size)
+        ]
+
+    def _build_overlays(self) -> None:
+        """Build the screen-sized translucent overlay surfaces used by modals."""
+        self._dark_overlay = pygame.Surface(self.screen.get_size())
+        self._dark_overlay.set_alpha(180)
+        self._dark_overlay.fill((0, 0, 0))
+
+        self._red_tint_overlay = pygame.Surface(self.screen.get_size())
+        self._red_tint_overlay.set_alpha(50)
+        self._red_tint_overlay.fill((255, 0, 0))
+
     def _get_skip_counter_button_rect(self, layout: dict) -> pygame.Rect:
         """Get the rectangle for the Skip Counter button."""
         button_width = 150
         button_height = 50
+        screen_width, screen_height = self.screen.get_size()
         # Position to the right of the staged card (same as resolve button area)
-        staging_x = (self.screen.get_width() - layout['card_width']) // 2
-        staging_y = (self.screen.get_height() - layout['card_height']) // 2
+        staging_x = (screen_width - layout['card_width']) // 2
+        staging_y = (screen_height - layout['card_height']) // 2
         button_x = staging_x + layout['card_width'] + 40
         button_y = staging_y + layout['card_height'] // 2 - button_height // 2
         return pygame.Rect(button_x, button_y, button_width, button_height)
 
+    def _render_cached_text(self, slot: str, value: tuple, template: str,
+                            font: pygame.font.Font, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get the text surface for a HUD slot, re-rendering only when its value changes.
+
+        Args:
+            slot: Unique key identifying this piece of text
+            value: Values substituted into the template
+            template: Format string for the text
+            font: Font to render with
+            color: Text color
+
+        Returns:
+            Rendered text surface
+        """
+        cached = self._hud_text_cache.get(slot)
+        if cached is None or cached[0] != value:
+            surface = font.render(template.format(*value), True, color)
+            self._hud_text_cache[slot] = (value, surface)
+            return surface
+        return cached[1]
+
     def _render_hud(self) -> None:
         """Render the heads-up display (title, instructions, turn/round counters)."""
+        screen_width = self.screen.get_width()
+
         # Title
-        title_surface = self.font.render("Card Combat", True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 100))
+        title_surface = self._render_cached_text("title", (), "Card Combat", self.font, (255, 255, 255))
+        title_rect = title_surface.get_rect(center=(screen_width // 2, 100))
         self.screen.blit(title_surface, title_rect)
 
         # Instructions
-        instructions_surface = self.font.render("(ESC for menu)", True, (200, 200, 200))
-        instructions_rect = instructions_surface.get_rect(center=(self.screen.get_width() // 2, 200))
+        instructions_surface = self._render_cached_text("instructions", (), "(ESC for menu)", self.font, (200, 200, 200))
+        instructions_rect = instructions_surface.get_rect(center=(screen_width // 2, 200))
         self.screen.blit(instructions_surface, instructions_rect)
 
         # Turn and Round counters (top right)
         counter_height = 50
         counter_gap = 50
 
-        turn_text = f"Turn: {self.turn}"
-        turn_surface = self.font.render(turn_text, True, (255, 255, 100))
-        turn_rect = turn_surface.get_rect(topright=(self.screen.get_width() - 50, counter_height))
+        turn_surface = self._render_cached_text("turn", (self.turn,), "Turn: {}", self.font, (255, 255, 100))
+        turn_rect = turn_surface.get_rect(topright=(screen_width - 50, counter_height))
         self.screen.blit(turn_surface, turn_rect)
 
-        round_text = f"Round: {self.round}"
-        round_surface = self.font.render(round_text, True, (255, 255, 100))
-        round_rect = round_surface.get_rect(topright=(self.screen.get_width() - 50, counter_height + counter_gap))
+        round_surface = self._render_cached_text("round", (self.round,), "Round: {}", self.font, (255, 255, 100))
+        round_rect = round_surface.get_rect(topright=(screen_width - 50, counter_height + counter_gap))
         self.screen.blit(round_surface, round_rect)
 
     def _render_hp_displays(self) -> None:
@@ -951,29 +1040,58 @@ class CardCombat:
         hp_y_start = self.screen.get_height() // 2 - 100
 
         # Opponent HP
-        opponent_name_surface = self.font.render(self.enemy.name, True, (255, 100, 100))
+        opponent_name_surface = self._render_cached_text("enemy_name", (self.enemy.name,), "{}",
+                                                         self.font, (255, 100, 100))
         self.screen.blit(opponent_name_surface, (hp_x, hp_y_start))
 
-        opponent_hp_text = f"HP: {self.enemy.hit_points}/{self.enemy.max_hit_points}"
-        opponent_hp_surface = self.card_font.render(opponent_hp_text, True, (255, 255, 255))
+        opponent_hp_surface = self._render_cached_text("enemy_hp", (self.enemy.hit_points, self.enemy.max_hit_points),
+                                                       "HP: {}/{}", self.card_font, (255, 255, 255))
         self.screen.blit(opponent_hp_surface, (hp_x, hp_y_start + 50))
 
-        opponent_discard_text = f"Discard pile: {len(self.enemy.discard_pile)} cards"
-        opponent_discard_surface = self.card_font.render(opponent_discard_text, True, (255, 255, 255))
+        opponent_discard_surface = self._render_cached_text("enemy_discard", (len(self.enemy.discard_pile),),
+                                                            "Discard pile: {} cards", self.card_font, (255, 255, 255))
         self.screen.blit(opponent_discard_surface, (hp_x, hp_y_start + 80))
 
         # Player HP
-        player_name_surface = self.font.render(self.player.name, True, (100, 200, 255))
+        player_name_surface = self._render_cached_text("player_name", (self.player.name,), "{}",
+                                                       self.font, (100, 200, 255))
         self.screen.blit(player_name_surface, (hp_x, hp_y_start + 120))
 
-        player_hp_text = f"HP: {self.player.hit_points}/{self.player.max_hit_points}"
-        player_hp_surface = self.card_font.render(player_hp_text, True, (255, 255, 255))
+        player_hp_surface = self._render_cached_text("player_hp", (self.player.hit_points, self.player.max_hit_points),
+                                                     "HP: {}/{}", self.card_font, (255, 255, 255))
         self.screen.blit(player_hp_surface, (hp_x, hp_y_start + 170))
 
-        player_discard_text = f"Discard pile: {len(self.player.discard_pile)} cards"
-        player_discard_surface = self.card_font.render(player_discard_text, True, (255, 255, 255))
+        player_discard_surface = self._render_cached_text("player_discard", (len(self.player.discard_pile),),
+                                                          "Discard pile: {} cards", self.card_font, (255, 255, 255))
         self.screen.blit(player_discard_surface, (hp_x, hp_y_start + 200))
 
+    def _get_deck_base_surface(self, label: str, bg_color: Tuple[int, int, int],
+                               border_color: Tuple[int, int, int], width: int, height: int) -> pygame.Surface:
+        """Get the static face of a deck (background, border and label).
+
+        Args:
+            label: Label text for the deck
+            bg_color: Background color
+            border_color: Border color
+            width: Deck width
+            height: Deck height
+
+        Returns:
+            Pre-rendered deck surface
+        """
+        key = (label, bg_color, border_color, width, height)
+        surface = self._deck_surface_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface((width, height))
+            surface.fill(bg_color)
+            pygame.draw.rect(surface, border_color, surface.get_rect(), 2)
+
+            deck_label = self.font.render(label, True, (255, 255, 255))
+            surface.blit(deck_label, deck_label.get_rect(center=(width // 2, 60)))
+
+            self._deck_surface_cache[key] = surface
+        return surface
+
     def _render_deck(self, x: int, y: int, layout: dict, label: str, card_count: int,
                      bg_color: Tuple[int, int, int], border_color: Tuple[int, int, int]) -> None:
         """Render a deck card (player or enemy).
@@ -990,31 +1108,24 @@ class CardCombat:
         card_width = layout['card_width']
         card_height = layout['card_height']
 
-        deck_rect = pygame.Rect(x, y, card_width, card_height)
-        pygame.draw.rect(self.screen, bg_color, deck_rect)
-        pygame.draw.rect(self.screen, border_color, deck_rect, 2)
-
-        # Deck label
-        deck_label = self.font.render(label, True, (255, 255, 255))
-        deck_label_rect = deck_label.get_rect(center=(x + card_width // 2, y + 60))
-        self.screen.blit(deck_label, deck_label_rect)
+        # Background, border and label never change, so they are baked once
+        self.screen.blit(self._get_deck_base_surface(label, bg_color, border_color, card_width, card_height), (x, y))
 
         # Card count
         x_loc = x + card_width // 2
-        deck_size = "Unknown"
         if label == "Deck":
-            deck_size = str(self.player_deck_size)
-            count_text = f"{card_count} cards"
-            count_text_2 = f"{deck_size} max"
+            count_surface = self._render_cached_text("deck_count", (card_count,), "{} cards",
+                                                     self.card_font, (255, 255, 255))
+            count_surface_2 = self._render_cached_text("deck_max", (self.player_deck_size,), "{} max",
+                                                       self.card_font, (255, 255, 255))
         elif label == "Enemy":
-            deck_size = str(self.enemy_deck_size)
-            count_text = f"Hand: {card_count}"
-            count_text_2 = f"Deck: {len(self.enemy.deck)} of {deck_size}"
+            count_surface = self._render_cached_text("enemy_hand", (card_count,), "Hand: {}",
+                                                     self.card_font, (255, 255, 255))
+            count_surface_2 = self._render_cached_text("enemy_deck", (len(self.enemy.deck), self.enemy_deck_size),
+                                                       "Deck: {} of {}", self.card_font, (255, 255, 255))
             x_loc = x + card_width // 3
 
-        count_surface = self.card_font.render(count_text, True, (255, 255, 255))
         count_rect = count_surface.get_rect(center=(x_loc, y + card_height // 2 + 20))
-        count_surface_2 = self.card_font.render(count_text_2, True, (255, 255, 255))
         count_rect_2 = count_surface.get_rect(center=(x_loc, y + card_height // 2 + 40))
         self.screen.blit(count_surface, count_rect)
         self.screen.blit(count_surface_2, count_rect_2)
@@ -1050,34 +1161,61 @@ class CardCombat:
             highlighted: Whether the card is highlighted/hovered
             border_color: Optional override for border color
         """
-        card_width = layout['card_width']
-        card_height = layout['card_height']
+        if border_color is None:
+            border_color = (255, 255, 100) if highlighted else (255, 255, 255)
+
+        card_surface = self._get_card_surface(card, highlighted, border_color,
+                                              layout['card_width'], layout['card_height'])
+        self.screen.blit(card_surface, (x, y))
+
+    def _get_card_surface(self, card: Card, highlighted: bool, border_color: Tuple[int, int, int],
+                          card_width: int, card_height: int) -> pygame.Surface:
+        """Get the composed face of a card, rendering it only the first time it is needed.
+
+        Card faces are cached by their content rather than by card instance, so
+        every copy of a card (and every frame of its animations) shares one surface.
+
+        Args:
+            card: The card to render
+            highlighted: Whether the card is highlighted/hovered
+            border_color: Border color
+            card_width: Card width
+            card_height: Card height
+
+        Returns:
+            Pre-rendered card surface
+        """
+        key = (card.name, card.description, card.damage, highlighted, border_color, card_width, card_height)
+        card_surface = self._card_surface_cache.get(key)
+        if card_surface is not None:
+            return card_surface
 
         # Determine colors
         bg_color = (70, 140, 70) if highlighted else (50, 100, 50)
-        if border_color is None:
-            border_color = (255, 255, 100) if highlighted else (255, 255, 255)
         border_width = 3 if highlighted else 2
 
-        card_rect = pygame.Rect(x, y, card_width, card_height)
-        pygame.draw.rect(self.screen, bg_color, card_rect)
-        pygame.draw.rect(self.screen, border_color, card_rect, border_width)
+        card_surface = pygame.Surface((card_width, card_height))
+        card_surface.fill(bg_color)
+        pygame.draw.rect(card_surface, border_color, card_surface.get_rect(), border_width)
 
         # Card name
         name_surface = self.card_font.render(card.name, True, (255, 255, 255))
-        name_rect = name_surface.get_rect(center=(x + card_width // 2, y + 30))
-        self.screen.blit(name_surface, name_rect)
+        name_rect = name_surface.get_rect(center=(card_width // 2, 30))
+        card_surface.blit(name_surface, name_rect)
 
         # Damage (if applicable)
-        if hasattr(card, 'damage'):
+        if card.damage is not None:
             damage_surface = self.font.render(str(card.damage), True, (255, 200, 0))
-            damage_rect = damage_surface.get_rect(center=(x + card_width // 2, y + card_height // 2))
-            self.screen.blit(damage_surface, damage_rect)
+            damage_rect = damage_surface.get_rect(center=(card_width // 2, card_height // 2))
+            card_surface.blit(damage_surface, damage_rect)
 
         # Description
         desc_surface = self.card_font.render(card.description, True, (200, 200, 200))
-        desc_rect = desc_surface.get_rect(center=(x + card_width // 2, y + card_height - 30))
-        self.screen.blit(desc_surface, desc_rect)
+        desc_rect = desc_surface.get_rect(center=(card_width // 2, card_height - 30))
+        card_surface.blit(desc_surface, desc_rect)
+
+        self._card_surface_cache[key] = card_surface
+        return card_surface
 
     def _render_empty_card_slot(self, x: int, y: int, layout: dict) -> None:
         """Render an empty card slot.
@@ -1106,9 +1244,6 @@ class CardCombat:
             player_can_act: Whether player can currently take actions
             layout: Card layout dimensions
         """
-        # Reset hovered card tracking
-        self.hovered_card_index = None
-
         # Allow interaction during player turn OR discard selection
         can_interact = player_can_act or self.state == CombatState.PLAYER_DISCARDING
 
@@ -1119,6 +1254,14 @@ class CardCombat:
         elif self.returning_card is not None and self.returning_card_index is not None:
             gap_index = self.returning_card_index
 
+        # Only redo hover detection when something it depends on has changed
+        hand_key = (mouse_pos, can_interact, self.last_stand_active, gap_index, self.state,
+                    tuple(id(card) for card in self.player.hand))
+        recompute_hover = hand_key != self._last_hand_key
+        if recompute_hover:
+            self._last_hand_key = hand_key
+            self.hovered_card_index = None
+
         for visual_slot in range(layout['hand_size']):
             card_x = layout['start_x'] + (visual_slot * (layout['card_width'] + layout['gap']))
 
@@ -1147,18 +1290,20 @@ class CardCombat:
             if self.state == CombatState.WAITING_FOR_COUNTER and card.card_type == CardType.DEFENSE:
                 continue
 
-            # Check hover state
-            base_card_rect = pygame.Rect(card_x, layout['card_y'], layout['card_width'], layout['card_height'])
-            is_hovering = base_card_rect.collidepoint(mouse_pos) and can_interact
+            if recompute_hover:
+                # Check hover state
+                is_hovering = self._hand_hit_rects[visual_slot].collidepoint(mouse_pos) and can_interact
 
-            # In Last Stand, only allow hovering Heal cards
-            if self.last_stand_active:
-                if not (hasattr(card, 'card_type') and card.card_type.value == 'heal'):
-                    is_hovering = False
+                # In Last Stand, only allow hovering Heal cards
+                if self.last_stand_active:
+                    if card.card_type != CardType.HEAL:
+                        is_hovering = False
 
-            # Update hovered card index if hovering
-            if is_hovering:
-                self.hovered_card_index = actual_index
+                # Update hovered card index if hovering
+                if is_hovering:
+                    self.hovered_card_index = actual_index
+            else:
+                is_hovering = actual_index == self.hovered_card_index
 
             # Also hover if selected for discard
             if self.discard_cards_hovered.get(actual_index, False):
@@ -1178,15 +1323,7 @@ class CardCombat:
         Returns:
             Appropriate button text for current state
         """
-        match self.state:
-            case CombatState.ENEMY_THINKING | CombatState.ENEMY_CARD_ANIMATING | CombatState.ENEMY_DISCARD_ANIMATING:
-                return "Enemy Turn"
-            case CombatState.VICTORY | CombatState.DEFEAT:
-                return "Combat Over"
-            case CombatState.PLAYER_DISCARDING:
-                return "Discarding"
-            case _:
-                return default_text
+        return BUTTON_STATE_TEXT.get(self.state, default_text)
 
     def _render_action_button(self, x: int, y: int, width: int, height: int,
                               text: str, enabled: bool, mouse_pos: Tuple[int, int],
@@ -1219,12 +1356,20 @@ class CardCombat:
         else:
             color = normal_color
 
-        pygame.draw.rect(self.screen, color, button_rect)
-        pygame.draw.rect(self.screen, (255, 255, 255), button_rect, 2)
+        # Button labels and colors come from a small closed set, so each
+        # variant is composed once and reused
+        key = (text, color, width, height)
+        button_surface = self._button_surface_cache.get(key)
+        if button_surface is None:
+            button_surface = pygame.Surface((width, height))
+            button_surface.fill(color)
+            pygame.draw.rect(button_surface, (255, 255, 255), button_surface.get_rect(), 2)
 
-        text_surface = self.card_font.render(text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=(x + width // 2, y + height // 2))
-        self.screen.blit(text_surface, text_rect)
+            text_surface = self.card_font.render(text, True, (255, 255, 255))
+            button_surface.blit(text_surface, text_surface.get_rect(center=(width // 2, height // 2)))
+            self._button_surface_cache[key] = button_surface
+
+        self.screen.blit(button_surface, button_rect)
 
         return is_hovering
 
@@ -1289,16 +1434,12 @@ class CardCombat:
         Args:
             layout: Card layout dimensions
         """
-        if self.state not in (CombatState.WAITING_FOR_RESOLVE, CombatState.RESOLVE_WITH_COUNTER):
-            return
-        if not self.staged_card:
-            return
-
         card_width = layout['card_width']
         card_height = layout['card_height']
 
-        staging_x = (self.screen.get_width() - card_width) // 2
-        staging_y = (self.screen.get_height() - card_height) // 2
+        screen_width, screen_height = self.screen.get_size()
+        staging_x = (screen_width - card_width) // 2
+        staging_y = (screen_height - card_height) // 2
 
         # Determine border color based on owner
         if self.staged_card_owner == "player":
@@ -1363,13 +1504,11 @@ class CardCombat:
         Args:
             mouse_pos: Current mouse position
         """
-        if self.state != CombatState.PLAYER_DISCARDING:
-            return
-
         modal_width = 400
         modal_height = 130
-        modal_x = (self.screen.get_width() - modal_width) // 2
-        modal_y = (self.screen.get_height() - modal_height) // 2
+        screen_width, screen_height = self.screen.get_size()
+        modal_x = (screen_width - modal_width) // 2
+        modal_y = (screen_height - modal_height) // 2
 
         # Modal background
         modal_rect = pygame.Rect(modal_x, modal_y, modal_width, modal_height)
@@ -1411,30 +1550,27 @@ class CardCombat:
 
     def _render_counter_prompt(self, mouse_pos: Tuple[int, int], layout: dict) -> None:
         """Render the counter prompt when player can respond to an attack."""
-        if self.state != CombatState.WAITING_FOR_COUNTER:
-            return
-
         # Render the staged attack card (same position as normal staged card)
         card_width = layout['card_width']
         card_height = layout['card_height']
-        staging_x = (self.screen.get_width() - card_width) // 2
-        staging_y = (self.screen.get_height() - card_height) // 2
+        screen_width, screen_height = self.screen.get_size()
+        staging_x = (screen_width - card_width) // 2
+        staging_y = (screen_height - card_height) // 2
 
         # Draw the attack card with red border (enemy's card)
         self._render_card(self.staged_card, staging_x, staging_y, layout,
                          highlighted=True, border_color=(255, 100, 100))
 
         # Draw "COUNTER?" prompt above the card
-        prompt_font = pygame.font.Font(None, 56)
-        prompt_surface = prompt_font.render("COUNTER?", True, (255, 255, 100))
-        prompt_rect = prompt_surface.get_rect(center=(self.screen.get_width() // 2, staging_y - 40))
+        prompt_surface = self._prompt_font.render("COUNTER?", True, (255, 255, 100))
+        prompt_rect = prompt_surface.get_rect(center=(screen_width // 2, staging_y - 40))
         self.screen.blit(prompt_surface, prompt_rect)
 
         # Draw damage indicator
-        if hasattr(self.staged_card, 'damage'):
+        if self.staged_card.damage is not None:
             damage_text = f"Incoming: {self.staged_card.damage} damage"
             damage_surface = self.card_font.render(damage_text, True, (255, 150, 150))
-            damage_rect = damage_surface.get_rect(center=(self.screen.get_width() // 2, staging_y - 10))
+            damage_rect = damage_surface.get_rect(center=(screen_width // 2, staging_y - 10))
             self.screen.blit(damage_surface, damage_rect)
 
         # Draw Skip button
@@ -1467,19 +1603,17 @@ class CardCombat:
         # Draw instruction text
         instruction_text = "Click a DEFENSE card to counter, or Skip"
         instruction_surface = self.card_font.render(instruction_text, True, (200, 200, 200))
-        instruction_rect = instruction_surface.get_rect(center=(self.screen.get_width() // 2,
+        instruction_rect = instruction_surface.get_rect(center=(screen_width // 2,
                                                                 layout['card_y'] - layout['hover_lift'] - 20))
         self.screen.blit(instruction_surface, instruction_rect)
 
     def _render_enemy_thinking_overlay(self) -> None:
         """Render the 'Enemy Thinking' overlay."""
-        if self.state != CombatState.ENEMY_THINKING:
-            return
-
         box_width = 300
         box_height = 100
-        box_x = (self.screen.get_width() - box_width) // 2
-        box_y = (self.screen.get_height() - box_height) // 2
+        screen_width, screen_height = self.screen.get_size()
+        box_x = (screen_width - box_width) // 2
+        box_y = (screen_height - box_height) // 2
 
         box_rect = pygame.Rect(box_x, box_y, box_width, box_height)
         pygame.draw.rect(self.screen, (100, 0, 0), box_rect)
@@ -1491,13 +1625,11 @@ class CardCombat:
 
     def _render_reshuffle_overlay(self) -> None:
         """Render the 'Reshuffling Deck' overlay."""
-        if self.state != CombatState.RESHUFFLING:
-            return
-
         box_width = 400
         box_height = 120
-        box_x = (self.screen.get_width() - box_width) // 2
-        box_y = (self.screen.get_height() - box_height) // 2
+        screen_width, screen_height = self.screen.get_size()
+        box_x = (screen_width - box_width) // 2
+        box_y = (screen_height - box_height) // 2
 
         # Color based on who is reshuffling
         if self.reshuffle_target == "player":
@@ -1526,18 +1658,11 @@ class CardCombat:
 
     def _render_last_stand_overlay(self) -> None:
         """Render the Last Stand emergency overlay."""
-        if not self.last_stand_active:
-            return
-            
         # Red tint overlay
-        overlay = pygame.Surface(self.screen.get_size())
-        overlay.set_alpha(50)
-        overlay.fill((255, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._red_tint_overlay, (0, 0))
         
         # Warning text
-        warning_font = pygame.font.Font(None, 64)
-        text_surface = warning_font.render("CRITICAL FAILURE // EMERGENCY SYSTEMS", True, (255, 50, 50))
+        text_surface = self._warning_font.render("CRITICAL FAILURE // EMERGENCY SYSTEMS", True, (255, 50, 50))
         text_rect = text_surface.get_rect(center=(self.screen.get_width() // 2, 150))
         # Add a slight pulse or background to make it readable? Simple is fine for now.
         self.screen.blit(text_surface, text_rect)
@@ -1548,9 +1673,6 @@ class CardCombat:
         Args:
             mouse_pos: Current mouse position
         """
-        if not self.game_context.debug_mode:
-            return
-
         button_width = 150
         button_height = 60
         button_gap = 20
@@ -1590,10 +1712,7 @@ class CardCombat:
 
     def _render_overlay(self) -> None:
         """Render a semi-transparent dark overlay."""
-        overlay = pygame.Surface(self.screen.get_size())
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dark_overlay, (0, 0))
 
     def _render_end_game_modal(self, title: str, title_color: Tuple[int, int, int],
                                 bg_color: Tuple[int, int, int],
@@ -1610,74 +1729,80 @@ class CardCombat:
 
         modal_width = 600
         modal_height = 300
-        modal_x = (self.screen.get_width() - modal_width) // 2
-        modal_y = (self.screen.get_height() - modal_height) // 2
+        screen_width, screen_height = self.screen.get_size()
+        modal_x = (screen_width - modal_width) // 2
+        modal_y = (screen_height - modal_height) // 2
 
         modal_rect = pygame.Rect(modal_x, modal_y, modal_width, modal_height)
         pygame.draw.rect(self.screen, bg_color, modal_rect)
         pygame.draw.rect(self.screen, border_color, modal_rect, 5)
 
         # Title
-        title_font = pygame.font.Font(None, 72)
-        title_surface = title_font.render(title, True, title_color)
-        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, modal_y + 80))
+        title_surface = self._title_font.render(title, True, title_color)
+        title_rect = title_surface.get_rect(center=(screen_width // 2, modal_y + 80))
         self.screen.blit(title_surface, title_rect)
 
         # Continue instruction
         continue_text = self.card_font.render("Press SPACE or click to continue", True, (200, 200, 200))
-        continue_rect = continue_text.get_rect(center=(self.screen.get_width() // 2, modal_y + 200))
+        continue_rect = continue_text.get_rect(center=(screen_width // 2, modal_y + 200))
         self.screen.blit(continue_text, continue_rect)
 
     def _render_victory_modal(self) -> None:
         """Render the victory modal."""
-        if self.state == CombatState.VICTORY:
-            self._render_end_game_modal("VICTORY!", (255, 255, 0), (0, 100, 0), (255, 255, 0))
+        self._render_end_game_modal("VICTORY!", (255, 255, 0), (0, 100, 0), (255, 255, 0))
 
     def _render_defeat_modal(self) -> None:
         """Render the defeat modal."""
-        if self.state == CombatState.DEFEAT:
-            self._render_end_game_modal("DEFEAT!", (255, 100, 100), (100, 0, 0), (255, 0, 0))
+        self._render_end_game_modal("DEFEAT!", (255, 100, 100), (100, 0, 0), (255, 0, 0))
 
     def _render_exit_confirmation_modal(self) -> None:
         """Render the exit confirmation modal."""
-        if not self.exit_confirmation_modal:
-            return
-
         self._render_overlay()
 
         modal_width = 600
         modal_height = 250
-        modal_x = (self.screen.get_width() - modal_width) // 2
-        modal_y = (self.screen.get_height() - modal_height) // 2
+        screen_width, screen_height = self.screen.get_size()
+        modal_x = (screen_width - modal_width) // 2
+        modal_y = (screen_height - modal_height) // 2
 
         modal_rect = pygame.Rect(modal_x, modal_y, modal_width, modal_height)
         pygame.draw.rect(self.screen, (50, 50, 100), modal_rect)
         pygame.draw.rect(self.screen, (200, 200, 255), modal_rect, 5)
 
         # Title
-        sure_font = pygame.font.Font(None, 56)
-        sure_text = sure_font.render("Exit to Menu?", True, (255, 255, 255))
-        sure_rect = sure_text.get_rect(center=(self.screen.get_width() // 2, modal_y + 70))
+        sure_text = self._prompt_font.render("Exit to Menu?", True, (255, 255, 255))
+        sure_rect = sure_text.get_rect(center=(screen_width // 2, modal_y + 70))
         self.screen.blit(sure_text, sure_rect)
 
         # Instructions
         enter_text = self.card_font.render("Press ENTER to confirm", True, (150, 255, 150))
-        enter_rect = enter_text.get_rect(center=(self.screen.get_width() // 2, modal_y + 140))
+        enter_rect = enter_text.get_rect(center=(screen_width // 2, modal_y + 140))
         self.screen.blit(enter_text, enter_rect)
 
         esc_text = self.card_font.render("Press ESC to cancel", True, (255, 150, 150))
-        esc_rect = esc_text.get_rect(center=(self.screen.get_width() // 2, modal_y + 180))
+        esc_rect = esc_text.get_rect(center=(screen_width // 2, modal_y + 180))
         self.screen.blit(esc_text, esc_rect)
 
     # =========================================================================
     # MAIN RENDER METHOD
     # =========================================================================
 
+    def invalidate(self) -> None:
+        """Force the next render to redraw even if nothing changed."""
+        self._dirty = True
+
     def render(self) -> None:
         """Render the card combat screen."""
         mouse_pos = pygame.mouse.get_pos()
+
+        # Nothing changed since the last frame - the screen still holds it
+        if not self._dirty and not self.active_animations and mouse_pos == self._last_mouse_pos:
+            return
+        self._dirty = False
+        self._last_mouse_pos = mouse_pos
+
         player_can_act = self._can_player_act()
-        layout = self._get_card_layout()
+        layout = self._layout
 
         # Clear screen
         self.screen.fill((0, 0, 64))
@@ -1689,19 +1814,33 @@ class CardCombat:
         self._render_player_hand(mouse_pos, player_can_act, layout)
         self._render_action_buttons(mouse_pos, player_can_act, layout)
 
+        # Overlay helpers are only called when they have something to draw
+        state = self.state
+
         # Render cards in motion/staging
-        self._render_animating_cards(layout)
-        self._render_staged_card(layout)
+        if self.active_animations:
+            self._render_animating_cards(layout)
+        if state in (CombatState.WAITING_FOR_RESOLVE, CombatState.RESOLVE_WITH_COUNTER) and self.staged_card:
+            self._render_staged_card(layout)
 
         # Render overlays and modals
-        self._render_discard_modal(mouse_pos)
-        self._render_counter_prompt(mouse_pos, layout)
-        self._render_enemy_thinking_overlay()
-        self._render_reshuffle_overlay()
-        self._render_last_stand_overlay()
-        self._render_debug_buttons(mouse_pos)
+        if state == CombatState.PLAYER_DISCARDING:
+            self._render_discard_modal(mouse_pos)
+        elif state == CombatState.WAITING_FOR_COUNTER:
+            self._render_counter_prompt(mouse_pos, layout)
+        elif state == CombatState.ENEMY_THINKING:
+            self._render_enemy_thinking_overlay()
+        elif state == CombatState.RESHUFFLING:
+            self._render_reshuffle_overlay()
+        if self.last_stand_active:
+            self._render_last_stand_overlay()
+        if self.game_context.debug_mode:
+            self._render_debug_buttons(mouse_pos)
 
         # Render end-game modals (these include their own overlay)
-        self._render_victory_modal()
-        self._render_defeat_modal()
-        self._render_exit_confirmation_modal()
+        if state == CombatState.VICTORY:
+            self._render_victory_modal()
+        elif state == CombatState.DEFEAT:
+            self._render_defeat_modal()
+        if self.exit_confirmation_modal:
+            self._render_exit_confirmation_modal()
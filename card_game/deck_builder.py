@@ -1,9 +1,42 @@
 """Deck builder engine for creating and managing decks."""
 
 import pygame
-from typing import Optional, Dict
+from collections import Counter
+from typing import Optional, Dict, Tuple
 from game_context import GameContext
 from card_game.card_registry import create_card
+from shared.fonts import get_font
+
+
+def _truncate_text(text: str, font: pygame.font.Font, max_width: int) -> str:
+    """
+    Shorten text with a trailing ellipsis so it fits within a pixel width.
+
+    Args:
+        text: Text to fit
+        font: Font the text will be rendered with
+        max_width: Maximum rendered width in pixels
+
+    Returns:
+        The original text if it fits, otherwise the longest prefix that fits
+        with "..." appended
+    """
+    if font.size(text)[0] <= max_width:
+        return text
+
+    # Binary search for the longest prefix that fits with the ellipsis
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if font.size(text[:mid] + "...")[0] <= max_width:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low].rstrip() + "..."
+
+
+# Event types DeckBuilder reacts to; everything else is skipped early
+HANDLED_EVENT_TYPES = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN))
 
 
 class DeckBuilder:
@@ -13,6 +46,20 @@ class DeckBuilder:
     This engine allows players to create and modify decks.
     """
 
+    # Card list layout
+    CARD_LIST_START_Y = 150
+    CARD_WIDTH = 600
+    CARD_HEIGHT = 100
+    CARD_GAP = 10
+
+    # Text offsets relative to the top-left corner of each card
+    CARD_TEXT_OFFSETS = {
+        'name': (10, 10),
+        'type': (10, 50),
+        'count': (200, 50),
+        'desc': (10, 75),
+    }
+
     def __init__(self, screen: pygame.Surface, context: GameContext):
         """
         Initialize the deck builder engine.
@@ -23,11 +70,53 @@ class DeckBuilder:
         """
         self.screen = screen
         self.context = context
-        self.font = pygame.font.Font(None, 48)
-        self.card_font = pygame.font.Font(None, 24)
+        self.font = get_font(48)
+        self.card_font = get_font(24)
         self.button_rect = None
         self.mouse_over_button = False
 
+        # Every card row shares the same background and border, so draw it once
+        self._card_frame = pygame.Surface((self.CARD_WIDTH, self.CARD_HEIGHT))
+        self._card_frame.fill((80, 40, 80))
+        pygame.draw.rect(self._card_frame, (200, 100, 200), self._card_frame.get_rect(), 2)
+
+        # Cached result of _get_card_counts; the key changes whenever the deck does
+        self._deck_version = 0
+        self._card_counts: Dict[str, tuple] = {}
+        self._card_counts_key = None
+
+        # Card descriptions shortened to fit the card, keyed by full text
+        self._truncated_descriptions: Dict[str, str] = {}
+
+        # Rendered text surfaces, keyed by (font id, text, color)
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+
+        # Composed screen frames, keyed by button hover state
+        self._frame_cache: Dict[bool, pygame.Surface] = {}
+        self._frame_key = None
+
+        # Whether the screen needs to be presented again; only input changes it
+        self._needs_redraw = True
+
+    def _render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render text, reusing a previously rendered surface when possible.
+
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+
+        Returns:
+            Rendered text surface
+        """
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
     def _get_card_counts(self) -> Dict[str, tuple]:
         """
         Get unique cards with their counts.
@@ -35,14 +124,21 @@ class DeckBuilder:
         Returns:
             Dictionary mapping card name to (card_object, count)
         """
+        deck = self.context.player_deck
+        counts_key = (id(deck), len(deck) if deck else 0, self._deck_version)
+        if counts_key == self._card_counts_key:
+            return self._card_counts
+
         card_counts = {}
-        if self.context.player_deck:
-            for card in self.context.player_deck:
-                if card.name not in card_counts:
-                    card_counts[card.name] = (card, 1)
-                else:
-                    existing_card, count = card_counts[card.name]
-                    card_counts[card.name] = (existing_card, count + 1)
+        if deck:
+            first_seen = {}
+            for card in deck:
+                first_seen.setdefault(card.name, card)
+            counts = Counter(card.name for card in deck)
+            card_counts = {name: (first_seen[name], count) for name, count in counts.items()}
+
+        self._card_counts = card_counts
+        self._card_counts_key = counts_key
         return card_counts
 
     def handle_events(self, events: list[pygame.event.Event]) -> Optional[str]:
@@ -55,16 +151,31 @@ class DeckBuilder:
         Returns:
             Action string for state transitions or None
         """
+        if events:
+            self._needs_redraw = True
+
         for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type not in HANDLED_EVENT_TYPES:
+                continue
+
+            if event.type == pygame.MOUSEMOTION:
+                # Button hover only changes when the cursor moves
+                self.mouse_over_button = bool(self.button_rect and self.button_rect.collidepoint(event.pos))
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     if self.button_rect and self.button_rect.collidepoint(event.pos):
                         # Add knife to deck
                         if self.context.player_deck is not None:
                             knife = create_card("knife")
                             self.context.player_deck.append(knife)
-            
-            if event.type == pygame.KEYDOWN:
+                            self._deck_version += 1
+                            # Card counts changed; only the count labels go stale,
+                            # the rest of the cached text is still valid
+                            for key in [key for key in self._text_cache if key[1].startswith("Count: ")]:
+                                del self._text_cache[key]
+
+            elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return 'menu'
         return None
@@ -80,87 +191,147 @@ class DeckBuilder:
 
     def render(self) -> None:
         """Render the deck builder screen."""
+        # The screen is static between inputs, so composed frames are reused
+        # until the deck or screen size changes (one frame per hover state)
+        deck = self.context.player_deck
+        frame_key = (id(deck), len(deck) if deck else 0, self._deck_version, self.screen.get_size())
+        if frame_key != self._frame_key:
+            self._frame_cache.clear()
+            self._frame_key = frame_key
+            self._place_button()
+
+        frame = self._frame_cache.get(self.mouse_over_button)
+        if frame is None:
+            frame = pygame.Surface(self.screen.get_size())
+            self._draw_frame(frame)
+            self._frame_cache[self.mouse_over_button] = frame
+
+        self.screen.blit(frame, (0, 0))
+        self._needs_redraw = False
+
+    def _place_button(self) -> None:
+        """
+        Position the Add Knife button for the current deck and screen size.
+
+        Hover is re-checked against the current mouse position, since the
+        button may have appeared or moved under a cursor that hasn't moved.
+        """
+        if self.context.player_deck:
+            button_width = 300
+            button_height = 60
+            button_x = (self.screen.get_width() - button_width) // 2
+            button_y = self.screen.get_height() - 100
+            self.button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
+        else:
+            self.button_rect = None
+        self.mouse_over_button = bool(self.button_rect and self.button_rect.collidepoint(pygame.mouse.get_pos()))
+
+    def invalidate(self) -> None:
+        """Force the next frame to be rendered and presented."""
+        self._needs_redraw = True
+
+    def wants_redraw(self) -> bool:
+        """
+        Check whether the screen has changed since the last render.
+
+        Returns:
+            True if render() and a display flip are needed this frame
+        """
+        return self._needs_redraw
+
+    def _draw_frame(self, target: pygame.Surface) -> None:
+        """
+        Draw the full deck builder screen onto a surface.
+
+        Args:
+            target: Surface to draw onto
+        """
+        # Text is queued and drawn in one batched blits() call after all
+        # rectangles, so it always ends up on top
+        blit_seq = []
+
         # Dark purple background
-        self.screen.fill((64, 0, 64))
+        target.fill((64, 0, 64))
 
         # Title
-        title_surface = self.font.render("Deck Builder", True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 50))
-        self.screen.blit(title_surface, title_rect)
+        title_surface = self._render_text(self.font, "Deck Builder", (255, 255, 255))
+        title_rect = title_surface.get_rect(center=(target.get_width() // 2, 50))
+        blit_seq.append((title_surface, title_rect))
 
         # Instructions
-        instructions_surface = self.card_font.render("(ESC for menu)", True, (200, 200, 200))
-        instructions_rect = instructions_surface.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(instructions_surface, instructions_rect)
+        instructions_surface = self._render_text(self.card_font, "(ESC for menu)", (200, 200, 200))
+        instructions_rect = instructions_surface.get_rect(center=(target.get_width() // 2, 100))
+        blit_seq.append((instructions_surface, instructions_rect))
 
         # Display deck
         if not self.context.player_deck:
-            no_deck_surface = self.font.render("No deck available", True, (150, 150, 150))
-            no_deck_rect = no_deck_surface.get_rect(center=(self.screen.get_width() // 2, 300))
-            self.screen.blit(no_deck_surface, no_deck_rect)
+            no_deck_surface = self._render_text(self.font, "No deck available", (150, 150, 150))
+            no_deck_rect = no_deck_surface.get_rect(center=(target.get_width() // 2, 300))
+            blit_seq.append((no_deck_surface, no_deck_rect))
         else:
             # Get unique cards with counts
             card_counts = self._get_card_counts()
 
             # Display cards
-            start_y = 150
-            card_height = 100
-            card_width = 600
-            gap = 10
-            x = (self.screen.get_width() - card_width) // 2
+            card_height = self.CARD_HEIGHT
+            card_width = self.CARD_WIDTH
+            row_height = card_height + self.CARD_GAP
+            damage_center_y = card_height // 2
+            name_dx, name_dy = self.CARD_TEXT_OFFSETS['name']
+            type_dx, type_dy = self.CARD_TEXT_OFFSETS['type']
+            count_dx, count_dy = self.CARD_TEXT_OFFSETS['count']
+            desc_dx, desc_dy = self.CARD_TEXT_OFFSETS['desc']
+            x = (target.get_width() - card_width) // 2
+            card_frame_seq = []
 
             for i, (card_name, (card, count)) in enumerate(card_counts.items()):
-                y = start_y + (i * (card_height + gap))
+                y = self.CARD_LIST_START_Y + (i * row_height)
 
                 # Card background
-                card_rect = pygame.Rect(x, y, card_width, card_height)
-                pygame.draw.rect(self.screen, (80, 40, 80), card_rect)
-                pygame.draw.rect(self.screen, (200, 100, 200), card_rect, 2)
+                card_frame_seq.append((self._card_frame, (x, y)))
 
                 # Card name
-                name_surface = self.font.render(card.name, True, (255, 255, 100))
-                self.screen.blit(name_surface, (x + 10, y + 10))
+                name_surface = self._render_text(self.font, card.name, (255, 255, 100))
+                blit_seq.append((name_surface, (x + name_dx, y + name_dy)))
 
                 # Card type
                 type_text = f"Type: {card.card_type.value}"
-                type_surface = self.card_font.render(type_text, True, (200, 200, 200))
-                self.screen.blit(type_surface, (x + 10, y + 50))
+                type_surface = self._render_text(self.card_font, type_text, (200, 200, 200))
+                blit_seq.append((type_surface, (x + type_dx, y + type_dy)))
 
-                # Card description
-                desc_surface = self.card_font.render(card.description, True, (180, 180, 180))
-                self.screen.blit(desc_surface, (x + 10, y + 70))
+                # Card description, cut to the card width
+                description = self._truncated_descriptions.get(card.description)
+                if description is None:
+                    description = _truncate_text(card.description, self.card_font, card_width - 2 * desc_dx)
+                    self._truncated_descriptions[card.description] = description
+                desc_surface = self._render_text(self.card_font, description, (180, 180, 180))
+                blit_seq.append((desc_surface, (x + desc_dx, y + desc_dy)))
 
-                # Count
+                # Count (on the type row, so it no longer overlaps the description)
                 count_text = f"Count: {count}"
-                count_surface = self.card_font.render(count_text, True, (255, 200, 100))
-                self.screen.blit(count_surface, (x + 10, y + 75))
+                count_surface = self._render_text(self.card_font, count_text, (255, 200, 100))
+                blit_seq.append((count_surface, (x + count_dx, y + count_dy)))
 
                 # Damage (if present)
-                if hasattr(card, 'damage'):
+                if card.damage is not None:
                     damage_text = f"Damage: {card.damage}"
-                    damage_surface = self.font.render(damage_text, True, (255, 100, 100))
-                    damage_rect = damage_surface.get_rect(right=x + card_width - 10, centery=y + card_height // 2)
-                    self.screen.blit(damage_surface, damage_rect)
+                    damage_surface = self._render_text(self.font, damage_text, (255, 100, 100))
+                    damage_rect = damage_surface.get_rect(right=x + card_width - 10, centery=y + damage_center_y)
+                    blit_seq.append((damage_surface, damage_rect))
 
-            # Add Knife button at bottom
-            button_width = 300
-            button_height = 60
-            button_x = (self.screen.get_width() - button_width) // 2
-            button_y = self.screen.get_height() - 100
-
-            self.button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-
-            # Check mouse hover
-            mouse_pos = pygame.mouse.get_pos()
-            self.mouse_over_button = self.button_rect.collidepoint(mouse_pos)
+            # Card backgrounds go down before the button so it stays on top
+            target.blits(card_frame_seq, doreturn=False)
 
+            # Add Knife button at bottom, placed by _place_button()
             # Button color based on hover
             button_color = (100, 150, 100) if self.mouse_over_button else (60, 100, 60)
-            pygame.draw.rect(self.screen, button_color, self.button_rect)
-            pygame.draw.rect(self.screen, (150, 255, 150), self.button_rect, 3)
+            pygame.draw.rect(target, button_color, self.button_rect)
+            pygame.draw.rect(target, (150, 255, 150), self.button_rect, 3)
 
             # Button text
             button_text = "Add Knife To Deck"
-            button_surface = self.card_font.render(button_text, True, (255, 255, 255))
+            button_surface = self._render_text(self.card_font, button_text, (255, 255, 255))
             button_text_rect = button_surface.get_rect(center=self.button_rect.center)
-            self.screen.blit(button_surface, button_text_rect)
+            blit_seq.append((button_surface, button_text_rect))
+
+        target.blits(blit_seq, doreturn=False)
@@ -5,6 +5,37 @@ from card_game.card_registry import create_card
 from card_game.card import Card
 
 
+# Deck compositions as card IDs, in deck order
+STARTER_DECK = (
+    ("kinetic_sidearm",) * 5         # 5x Kinetic Sidearm
+    + ("knife",) * 5                 # 5x Knife
+    + ("kinetic_battle_rifle",) * 2  # 2x Kinetic Battle Rifle
+    + ("med_patch",) * 2             # 2x Med Patch
+    + ("energy_shield",) * 2         # 2x Energy Shield (defense)
+)
+
+INTRO_ENEMY_DECK = (
+    ("knife",) * 6                   # 6x Knife (basic low damage)
+    + ("kinetic_sidearm",) * 4       # 4x Kinetic Sidearm (medium damage)
+    + ("kinetic_battle_rifle",) * 2  # 2x Kinetic Battle Rifle (higher damage)
+)
+
+CHAPTER_BOSS_DECK = (
+    ("knife",) * 3                   # 3x Knife (some basic attacks)
+    + ("kinetic_sidearm",) * 5       # 5x Kinetic Sidearm (solid medium damage)
+    + ("kinetic_battle_rifle",) * 4  # 4x Kinetic Battle Rifle (heavy damage focus)
+)
+
+GRINDER_ENEMY_DECK = (
+    ("knife",) * 5                   # 5x Knife (basic attacks)
+    + ("kinetic_sidearm",) * 5       # 5x Kinetic Sidearm (balanced medium damage)
+    + ("kinetic_battle_rifle",) * 2  # 2x Kinetic Battle Rifle (some heavy hits)
+    + ("med_patch",) * 2             # 2x Med Patch
+)
+
+TEST_SMALL_DECK = ("kinetic_sidearm",) * 5  # 5x Kinetic Sidearm
+
+
 def create_starter_deck() -> List[Card]:
     """
     Create a starter deck for new players.
@@ -12,114 +43,46 @@ def create_starter_deck() -> List[Card]:
     Returns:
         List of Card instances representing the starter deck
     """
-    deck = []
-
-    # Add 5x Kinetic Sidearm
-    for _ in range(5):
-        deck.append(create_card("kinetic_sidearm"))
-
-    # Add 5x Knife
-    for _ in range(5):
-        deck.append(create_card("knife"))
-
-    # Add 2x Kinetic Battle Rifle
-    for _ in range(2):
-        deck.append(create_card("kinetic_battle_rifle"))
-
-    # Add 2x Med Patch
-    for _ in range(2):
-        deck.append(create_card("med_patch"))
-
-    # Add 2x Energy Shield (defense)
-    for _ in range(2):
-        deck.append(create_card("energy_shield"))
-
-    return deck
+    return [create_card(card_id) for card_id in STARTER_DECK]
 
 
 def create_intro_enemy_deck() -> List[Card]:
     """
     Create an enemy deck for the intro battle.
-    
+
     This deck provides a moderate challenge for new players,
     focusing on basic attacks with some variety.
 
     Returns:
         List of Card instances representing the intro enemy deck
     """
-    deck = []
-
-    # Add 6x Knife (basic low damage)
-    for _ in range(6):
-        deck.append(create_card("knife"))
-
-    # Add 4x Kinetic Sidearm (medium damage)
-    for _ in range(4):
-        deck.append(create_card("kinetic_sidearm"))
-
-    # Add 2x Kinetic Battle Rifle (higher damage)
-    for _ in range(2):
-        deck.append(create_card("kinetic_battle_rifle"))
-
-    return deck
+    return [create_card(card_id) for card_id in INTRO_ENEMY_DECK]
 
 
 def create_chapter_boss_deck() -> List[Card]:
     """
     Create an enemy deck for the chapter boss battle.
-    
+
     This deck provides a challenging encounter with more powerful cards
     and better composition than the intro battle.
 
     Returns:
         List of Card instances representing the chapter boss deck
     """
-    deck = []
-
-    # Add 3x Knife (some basic attacks)
-    for _ in range(3):
-        deck.append(create_card("knife"))
-
-    # Add 5x Kinetic Sidearm (solid medium damage)
-    for _ in range(5):
-        deck.append(create_card("kinetic_sidearm"))
-
-    # Add 4x Kinetic Battle Rifle (heavy damage focus)
-    for _ in range(4):
-        deck.append(create_card("kinetic_battle_rifle"))
-
-    return deck
+    return [create_card(card_id) for card_id in CHAPTER_BOSS_DECK]
 
 
 def create_grinder_enemy_deck() -> List[Card]:
     """
     Create an enemy deck for optional grinder battles.
-    
+
     This deck provides a balanced challenge for players who want
     to practice and earn rewards without story progression requirements.
 
     Returns:
         List of Card instances representing the grinder enemy deck
     """
-    deck = []
-
-    # Add 5x Knife (basic attacks)
-    for _ in range(5):
-        deck.append(create_card("knife"))
-
-    # Add 5x Kinetic Sidearm (balanced medium damage)
-    for _ in range(5):
-        deck.append(create_card("kinetic_sidearm"))
-
-    # Add 2x Kinetic Battle Rifle (some heavy hits)
-    for _ in range(2):
-        deck.append(create_card("kinetic_battle_rifle"))
-
-    # Add 2x Med Patch
-    for _ in range(2):
-        deck.append(create_card("med_patch"))
-
-    return deck
+    return [create_card(card_id) for card_id in GRINDER_ENEMY_DECK]
 
 def create_test_small_deck() -> List[Card]:
     """
@@ -128,10 +91,4 @@ def create_test_small_deck() -> List[Card]:
     Returns:
         List of Card instances representing the starter deck
     """
-    deck = []
-
-    # Add 5x Kinetic Sidearm
-    for _ in range(5):
-        deck.append(create_card("kinetic_sidearm"))
-
-    return deck
\ No newline at end of file
+    return [create_card(card_id) for card_id in TEST_SMALL_DECK]
@@ -1,8 +1,10 @@
 """Player and hand management for card combat."""
 
 import random
-from typing import List, Optional
+from collections import deque
+from typing import Deque, Iterable, List, Optional
 from card_game.card import Card
+from card_game.sim_core import resolve_damage, resolve_heal
 
 
 class Player:
@@ -12,6 +14,9 @@ class Player:
     Tracks health, hand, deck, and provides methods for damage/healing.
     """
 
+    # Fixed attribute layout; the draw pile lives in _deck behind the deck property
+    __slots__ = ("name", "max_hit_points", "hit_points", "hand", "_deck", "discard_pile")
+
     def __init__(self, name: str, max_hit_points: int = 20):
         """
         Initialize a player.
@@ -24,9 +29,23 @@ class Player:
         self.max_hit_points = max_hit_points
         self.hit_points = max_hit_points
         self.hand: List[Card] = []
-        self.deck: List[Card] = []
+        self.deck: Deque[Card] = deque()
         self.discard_pile: List[Card] = []
 
+    @property
+    def deck(self) -> Deque[Card]:
+        """
+        Draw pile, with the top of the deck on the left.
+
+        Stored as a deque so drawing from the top is O(1). Assigning any
+        iterable of cards (e.g. a list from deck_factory) converts it.
+        """
+        return self._deck
+
+    @deck.setter
+    def deck(self, cards: Iterable[Card]) -> None:
+        self._deck = deque(cards)
+
     def take_damage(self, amount: int) -> int:
         """
         Take damage and reduce HP.
@@ -37,8 +56,7 @@ class Player:
         Returns:
             Actual damage taken (can't go below 0 HP)
         """
-        actual_damage = min(amount, self.hit_points)
-        self.hit_points -= actual_damage
+        self.hit_points, actual_damage = resolve_damage(self.hit_points, amount)
         return actual_damage
 
     def heal(self, amount: int) -> int:
@@ -51,8 +69,7 @@ class Player:
         Returns:
             Actual HP healed (can't exceed max)
         """
-        actual_healing = min(amount, self.max_hit_points - self.hit_points)
-        self.hit_points += actual_healing
+        self.hit_points, actual_healing = resolve_heal(self.hit_points, self.max_hit_points, amount)
         return actual_healing
 
     def is_alive(self) -> bool:
@@ -83,7 +100,7 @@ class Player:
         if not self.deck:
             return None
 
-        card = self.deck.pop(0)
+        card = self.deck.popleft()
         self.hand.append(card)
         return card
 
@@ -108,9 +125,11 @@ class Player:
 
     def shuffle_deck(self) -> None:
         """
-        Shuffle the deck in place.
+        Shuffle the deck.
         """
-        random.shuffle(self.deck)
+        cards = list(self.deck)
+        random.shuffle(cards)
+        self.deck = cards
 
     def reset_deck(self) -> None:
         """
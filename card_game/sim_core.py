@@ -0,0 +1,66 @@
+"""
+Pure integer combat kernels.
+
+These functions hold the HP arithmetic used by Player so that simulation
+code (AI rollouts, balance testing) can run it without Player objects.
+When numba is installed they are JIT-compiled with an on-disk cache;
+otherwise they run as plain Python.
+"""
+
+from typing import Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def resolve_damage(hit_points: int, amount: int) -> Tuple[int, int]:
+    """
+    Apply damage to a hit point total.
+
+    Args:
+        hit_points: Current HP
+        amount: Amount of damage to take
+
+    Returns:
+        Tuple of (new HP, actual damage taken); HP can't go below 0
+    """
+    actual_damage = min(amount, hit_points)
+    return hit_points - actual_damage, actual_damage
+
+
+def resolve_heal(hit_points: int, max_hit_points: int, amount: int) -> Tuple[int, int]:
+    """
+    Apply healing to a hit point total.
+
+    Args:
+        hit_points: Current HP
+        max_hit_points: Maximum HP
+        amount: Amount to heal
+
+    Returns:
+        Tuple of (new HP, actual HP healed); HP can't exceed max
+    """
+    actual_healing = min(amount, max_hit_points - hit_points)
+    return hit_points + actual_healing, actual_healing
+
+
+if njit is not None:
+    resolve_damage = njit(cache=True)(resolve_damage)
+    resolve_heal = njit(cache=True)(resolve_heal)
+
+
+def warmup_sim() -> None:
+    """
+    Run each kernel once so JIT compilation happens at startup.
+
+    With numba installed this compiles the kernels (or loads them from the
+    on-disk cache, which numba places next to this module unless
+    NUMBA_CACHE_DIR is set) before gameplay needs them. Without numba it
+    does nothing.
+    """
+    if njit is None:
+        return
+    resolve_damage(1, 1)
+    resolve_heal(1, 2, 1)
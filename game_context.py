@@ -7,8 +7,67 @@ separation between game state (what's happening in the game) and flow state
 (which screen/mode we're in).
 """
 
-import pickle
+import json
+import os
 from typing import Optional, Any, List, Dict, Set
+import card_game.card  # noqa: F401 - registers card classes used when loading decks
+from card_game.card_registry import create_card
+
+
+# Default story context for the visual novel engine. The mutable containers
+# here must never be handed out; use _default_context() for a fresh copy.
+_DEFAULT_CONTEXT: Dict[str, Any] = {
+    'player_name': 'Recruit',  # Default name until set
+    'reputation': 0,  # Default reputation
+    'completed_trees': [],  # Track completed dialogue trees (legacy)
+    'choices': {}  # Track player choices
+}
+
+
+def _default_context() -> Dict[str, Any]:
+    """
+    Build a new story context dict from _DEFAULT_CONTEXT.
+
+    Returns:
+        Copy of the default context with its own mutable containers
+    """
+    return {**_DEFAULT_CONTEXT, 'completed_trees': [], 'choices': {}}
+
+
+def _deck_to_ids(deck: Optional[List[Any]]) -> Optional[List[str]]:
+    """
+    Convert a deck of cards to a list of card registry IDs for saving.
+
+    Args:
+        deck: List of Card instances, or None
+
+    Returns:
+        List of card IDs, or None if there is no deck
+
+    Raises:
+        ValueError: If a card has no registry ID and could not be loaded back
+    """
+    if deck is None:
+        return None
+    card_ids = [card.card_id for card in deck]
+    if None in card_ids:
+        raise ValueError(f"Card '{deck[card_ids.index(None)].name}' has no card ID and cannot be saved")
+    return card_ids
+
+
+def _deck_from_ids(card_ids: Optional[List[str]]) -> Optional[List[Any]]:
+    """
+    Rebuild a deck of cards from a list of card registry IDs.
+
+    Args:
+        card_ids: List of card IDs, or None
+
+    Returns:
+        List of new Card instances, or None if there is no deck
+    """
+    if card_ids is None:
+        return None
+    return [create_card(card_id) for card_id in card_ids]
 
 
 class GameContext:
@@ -35,12 +94,7 @@ class GameContext:
         self.battle_attempts: Dict[str, int] = {}  # Track battle attempt counts for difficulty assistance
         
         # Story context for visual novel engine with sensible defaults
-        self.context: dict = {
-            'player_name': 'Recruit',  # Default name until set
-            'reputation': 0,  # Default reputation
-            'completed_trees': [],  # Track completed dialogue trees (legacy)
-            'choices': {}  # Track player choices
-        }
+        self.context: dict = _default_context()
 
     def _debug_print(self) -> None:
         """Print debug information about the game context."""
@@ -59,10 +113,14 @@ class GameContext:
 
         Args:
             filename: Path to save file
+
+        Raises:
+            ValueError: If a deck card has no card ID
+            TypeError: If the context holds values JSON can't store
         """
         save_data = {
             'player_name': self.player_name,
-            'player_deck': self.player_deck,
+            'player_deck': _deck_to_ids(self.player_deck),
             'context': self.context,
             # Alpha 1 progression tracking fields
             'completed_battles': self.completed_battles,
@@ -70,8 +128,13 @@ class GameContext:
             'current_milestone': self.current_milestone,
             'battle_attempts': self.battle_attempts
         }
-        with open(filename, 'wb') as f:
-            pickle.dump(save_data, f)
+        # Serialize before touching the file and swap the new save in only once
+        # it is fully written, so a failed save never destroys the previous one
+        payload = json.dumps(save_data, separators=(',', ':'))
+        temp_filename = filename + '.tmp'
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(temp_filename, filename)
 
     def load(self, filename: str) -> None:
         """
@@ -79,31 +142,39 @@ class GameContext:
 
         Args:
             filename: Path to save file
+
+        Raises:
+            ValueError: If the file is not a JSON save or has unknown card IDs
         """
-        with open(filename, 'rb') as f:
-            save_data = pickle.load(f)
-        
-        self.player_name = save_data.get('player_name')
-        self.player_deck = save_data.get('player_deck')
-        
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                save_data = json.load(f)
+        except ValueError as e:
+            # Not JSON, e.g. a pickle save from before the JSON format
+            raise ValueError(f"'{os.path.basename(filename)}' is not a readable save file") from e
+
+        # Decode everything before assigning so a bad save (e.g. an unknown
+        # card ID) raises without leaving the context half-loaded
+        player_name = save_data.get('player_name')
+        player_deck = _deck_from_ids(save_data.get('player_deck'))
+
+        # Load context with defaults for missing keys (backward compatibility)
+        # Saved values (including any additional keys) override the defaults
+        context = _default_context()
+        if player_name:
+            context['player_name'] = player_name
+        context.update(save_data.get('context', {}))
+
+        self.player_name = player_name
+        self.player_deck = player_deck
+
         # Load Alpha 1 progression tracking fields with defaults for backward compatibility
         self.completed_battles = save_data.get('completed_battles', [])
         self.completed_dialogues = save_data.get('completed_dialogues', [])
         self.current_milestone = save_data.get('current_milestone', "chapter_start")
         self.battle_attempts = save_data.get('battle_attempts', {})
-        
-        # Load context with defaults for missing keys (backward compatibility)
-        loaded_context = save_data.get('context', {})
-        self.context = {
-            'player_name': loaded_context.get('player_name', self.player_name or 'Recruit'),
-            'reputation': loaded_context.get('reputation', 0),
-            'completed_trees': loaded_context.get('completed_trees', []),
-            'choices': loaded_context.get('choices', {})
-        }
-        # Preserve any additional keys that might have been added
-        for key, value in loaded_context.items():
-            if key not in self.context:
-                self.context[key] = value
+
+        self.context = context
 
     def reset(self) -> None:
         """Reset game context to initial state (for new game)."""
@@ -117,10 +188,5 @@ class GameContext:
         self.completed_dialogues = []
         self.current_milestone = "chapter_start"
         self.battle_attempts = {}
-        
-        self.context = {
-            'player_name': 'Recruit',  # Default name until set
-            'reputation': 0,  # Default reputation
-            'completed_trees': [],  # Track completed dialogue trees
-            'choices': {}  # Track player choices
-        }
+
+        self.context = _default_context()
@@ -10,10 +10,7 @@ import argparse
 from game_context import GameContext
 from state_manager import StateManager
 from states.menu_state import MenuState
-from states.card_combat_state import CardCombatState
-from states.load_game_state import LoadGameState
-from states.deck_builder_state import DeckBuilderState
-from states.card_registry_state import CardRegistryState
+from card_game.sim_core import warmup_sim
 
 
 def main(debug_mode = False):
@@ -21,6 +18,9 @@ def main(debug_mode = False):
     # Initialize pygame
     pygame.init()
 
+    # Compile combat kernels up front instead of on the first hit
+    warmup_sim()
+
     # Set up display (fullscreen)
     screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
     pygame.display.set_caption("Sci-Fi RPG Card Game")
@@ -31,6 +31,8 @@ def main(debug_mode = False):
     # Create clock for delta time tracking
     clock = pygame.time.Clock()
     FPS = 60
+    IDLE_FPS = 30  # Frame cap while the current screen is static
+    fps = FPS
 
     # Create game context (shared state across all game modes)
     context = GameContext()
@@ -38,12 +40,30 @@ def main(debug_mode = False):
     # Create state manager with screen reference and debug mode enabled
     state_manager = StateManager(screen, context, debug_mode=debug_mode)
 
-    # Register all game states
+    # Register all game states. The menu is entered right away; the others
+    # are registered as factories so their modules and engines are only
+    # imported when the player first opens them.
+    def create_card_combat_state():
+        from states.card_combat_state import CardCombatState
+        return CardCombatState(context, state_manager)
+
+    def create_load_game_state():
+        from states.load_game_state import LoadGameState
+        return LoadGameState(context, state_manager)
+
+    def create_deck_builder_state():
+        from states.deck_builder_state import DeckBuilderState
+        return DeckBuilderState(context, state_manager)
+
+    def create_card_registry_state():
+        from states.card_registry_state import CardRegistryState
+        return CardRegistryState(context, state_manager)
+
     state_manager.register_state('menu', MenuState(context, state_manager))
-    state_manager.register_state('card_combat', CardCombatState(context, state_manager))
-    state_manager.register_state('load_game', LoadGameState(context, state_manager))
-    state_manager.register_state('deck_builder', DeckBuilderState(context, state_manager))
-    state_manager.register_state('card_registry', CardRegistryState(context, state_manager))
+    state_manager.register_state('card_combat', create_card_combat_state)
+    state_manager.register_state('load_game', create_load_game_state)
+    state_manager.register_state('deck_builder', create_deck_builder_state)
+    state_manager.register_state('card_registry', create_card_registry_state)
 
     # Start at menu state
     state_manager.change_state('menu')
@@ -52,7 +72,7 @@ def main(debug_mode = False):
     running = True
     while running:
         # Calculate delta time in seconds
-        dt = clock.tick(FPS) / 1000.0
+        dt = clock.tick(fps) / 1000.0
 
         # Event handling
         events = pygame.event.get()
@@ -63,10 +83,19 @@ def main(debug_mode = False):
         # Delegate to current state
         state_manager.handle_events(events)
         state_manager.update(dt)
-        state_manager.render(screen)
 
-        # Update display
-        pygame.display.flip()
+        # Only render and flip when the state has something new to show
+        if state_manager.wants_redraw():
+            dirty = state_manager.render(screen)
+
+            # Update display, only the changed areas if the state reports them
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
+            fps = FPS
+        else:
+            fps = IDLE_FPS
 
     # Clean up
     pygame.quit()
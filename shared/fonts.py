@@ -0,0 +1,26 @@
+"""Shared font cache so screens reuse font objects instead of reopening them."""
+
+import pygame
+from typing import Dict, Optional, Tuple
+
+# Module-level cache of loaded fonts, keyed by (font file, size)
+_font_cache: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+
+def get_font(size: int, name: Optional[str] = None) -> pygame.font.Font:
+    """
+    Get a font, loading it only the first time it is requested.
+
+    Args:
+        size: Font size in points
+        name: Path to a font file, or None for the default pygame font
+
+    Returns:
+        Shared Font instance for this name and size
+    """
+    key = (name, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _font_cache[key] = font
+    return font
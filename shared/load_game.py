@@ -2,6 +2,7 @@
 
 import pygame
 from typing import Optional
+from shared.fonts import get_font
 
 
 class LoadGame:
@@ -19,7 +20,7 @@ class LoadGame:
             screen: Pygame surface for rendering
         """
         self.screen = screen
-        self.font = pygame.font.Font(None, 48)
+        self.font = get_font(48)
 
     def handle_events(self, events: list[pygame.event.Event]) -> Optional[str]:
         """
@@ -2,9 +2,11 @@
 
 import pygame
 import os
-import pickle
-from typing import Optional, List, Tuple
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Tuple, Dict
 from game_context import GameContext
+from shared.fonts import get_font
 
 
 class SaveManagement:
@@ -14,6 +16,21 @@ class SaveManagement:
     This engine handles saving and loading games.
     """
 
+    # Maximum number of rendered text surfaces kept in the text cache
+    TEXT_CACHE_SIZE = 64
+
+    # Maximum number of threads reading save metadata during a scan
+    META_READ_WORKERS = 8
+
+    # Fewer changed files than this are read serially, since starting the
+    # reader threads would cost more than the reads they parallelize
+    META_PARALLEL_MIN = 8
+
+    # Menu option rectangle size and vertical gap between options
+    OPTION_WIDTH = 400
+    OPTION_HEIGHT = 60
+    OPTION_GAP = 20
+
     def __init__(self, screen: pygame.Surface, context: GameContext):
         """
         Initialize the save management engine.
@@ -24,8 +41,8 @@ class SaveManagement:
         """
         self.screen = screen
         self.context = context
-        self.font = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 36)
+        self.font = get_font(48)
+        self.font_small = get_font(36)
         self.save_dir = "savegames"
         self.message = ""
         self.message_timer = 0.0
@@ -37,30 +54,338 @@ class SaveManagement:
             ("L - Load Game", "load"),
             ("ESC - Menu", "menu")
         ]
-        self.save_files: List[Tuple[str, str, int]] = []  # (filename, player_name, deck_count)
-        
+        # (filename, player_name, deck_count); deck_count is None for saves
+        # that can't be read, such as pickle saves from older versions
+        self.save_files: List[Tuple[str, str, Optional[int]]] = []
+
+        # Save file metadata by filename: (mtime_ns, player_name, deck_count).
+        # Files whose mtime hasn't changed are not re-read on the next scan.
+        self._meta_cache: Dict[str, Tuple[int, str, Optional[int]]] = {}
+
+        # Rendered text surfaces, keyed by (font id, text, color)
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+
+        # Saving and loading run on a worker thread so file I/O doesn't stall
+        # frames; update() polls the pending operation ("save" or "load")
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_future: Optional[Future] = None
+        self._pending_operation: Optional[str] = None
+
+        # Thread pool for reading save metadata, created by the first scan
+        # with enough changed files and reused by later scans
+        self._meta_executor: Optional[ThreadPoolExecutor] = None
+
+        # Options for the current mode as (label, action), built lazily by
+        # _current_options() and dropped by _invalidate_options()
+        self._options_cache: Optional[List[Tuple[str, str]]] = None
+        self._options_version = 0
+
+        # Per-option (bg_rect, text_rect, text_surface, top, bottom), valid for
+        # _layout_key; all options share the horizontal span _layout_x_range
+        self._layout: List[Tuple[pygame.Rect, pygame.Rect, pygame.Surface, int, int]] = []
+        self._layout_x_range: Tuple[int, int] = (0, 0)
+        self._layout_key: Optional[Tuple[int, int]] = None
+
+        # Everything the last rendered frame depended on; render() does nothing
+        # while it is unchanged because the screen already shows that frame
+        self._last_render_key: Optional[tuple] = None
+
         # Create savegames directory if it doesn't exist
         os.makedirs(self.save_dir, exist_ok=True)
 
-    def _scan_save_files(self) -> None:
-        """Scan savegames directory and load metadata from each save file."""
-        self.save_files = []
-        if not os.path.exists(self.save_dir):
-            return
-        
-        for filename in os.listdir(self.save_dir):
-            if filename.endswith('.dat'):
-                filepath = os.path.join(self.save_dir, filename)
+    def _invalidate_options(self) -> None:
+        """Drop the option list after the mode or save file list changed."""
+        self._options_cache = None
+        self._options_version += 1
+        self._layout_key = None
+
+    def _current_options(self) -> List[Tuple[str, str]]:
+        """
+        Get the options for the current mode, building them if needed.
+
+        Returns:
+            List of (label, action) tuples
+        """
+        if self._options_cache is None:
+            if self.mode == "load_select":
+                self._options_cache = [
+                    (f"{name} (unreadable save)" if count is None else f"{name} ({count} cards)",
+                     f"load_file:{filename}")
+                    for filename, name, count in self.save_files
+                ]
+                self._options_cache.append(("Back", "back"))
+            else:
+                self._options_cache = self.menu_options
+        return self._options_cache
+
+    def _rebuild_layout(self, start_y: int, screen_width: int) -> None:
+        """
+        Precompute option rectangles, text positions and text surfaces.
+
+        Args:
+            start_y: Vertical center of the first option
+            screen_width: Width of the screen the options are centered on
+        """
+        center_x = screen_width // 2
+        left_x = center_x - self.OPTION_WIDTH // 2
+        y_offset = start_y
+        self._layout = []
+        for option_text, _ in self._current_options():
+            option_surface = self._render_text(self.font_small, option_text, (255, 255, 255))
+            option_rect = option_surface.get_rect(center=(center_x, y_offset))
+            bg_rect = pygame.Rect(left_x, y_offset - self.OPTION_HEIGHT // 2, self.OPTION_WIDTH, self.OPTION_HEIGHT)
+            self._layout.append((bg_rect, option_rect, option_surface, bg_rect.top, bg_rect.bottom))
+            y_offset += self.OPTION_HEIGHT + self.OPTION_GAP
+        self._layout_x_range = (left_x, left_x + self.OPTION_WIDTH)
+        self._layout_key = (start_y, screen_width)
+
+    def _render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render text, reusing a previously rendered surface when possible.
+
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+
+        Returns:
+            Rendered text surface
+        """
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Messages and save names vary, so keep the cache from growing without bound
+            if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
+    def _write_save_meta(self, filepath: str, mtime: int, player_name: str, deck_count: int) -> None:
+        """
+        Write the small metadata sidecar for a save file.
+
+        The sidecar records the save's mtime so a save rewritten by other
+        means is detected and re-read instead of trusting stale metadata.
+
+        Args:
+            filepath: Path to the save file the sidecar describes
+            mtime: Modification time of the save file in nanoseconds
+            player_name: Player name stored in the save
+            deck_count: Number of cards in the saved deck
+        """
+        meta = {
+            'save_mtime_ns': mtime,
+            'player_name': player_name,
+            'deck_count': deck_count
+        }
+        with open(filepath + '.meta', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def _read_save_meta(self, filepath: str, mtime: int) -> Tuple[str, Optional[int]]:
+        """
+        Read the player name and deck size of a save file.
+
+        Uses the .meta sidecar when it matches the save, otherwise reads the
+        full save and writes a fresh sidecar for next time.
+
+        Args:
+            filepath: Path to the save file
+            mtime: Modification time of the save file in nanoseconds
+
+        Returns:
+            Tuple of (player_name, deck_count); for a file that isn't a JSON
+            save this is (file name without extension, None)
+        """
+        try:
+            with open(filepath + '.meta', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('save_mtime_ns') == mtime:
+                return meta['player_name'], meta['deck_count']
+        except (OSError, ValueError, KeyError):
+            # Missing or unreadable sidecar, fall back to the save itself
+            pass
+
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                save_data = json.load(f)
+        except ValueError:
+            # Not JSON (e.g. an old pickle save); list it so it doesn't vanish
+            return os.path.splitext(os.path.basename(filepath))[0], None
+        player_name = save_data.get('player_name', 'Unknown')
+        deck = save_data.get('player_deck', [])
+        deck_count = len(deck) if deck else 0
+
+        try:
+            self._write_save_meta(filepath, mtime, player_name, deck_count)
+        except OSError:
+            # The sidecar is only an optimization
+            pass
+        return player_name, deck_count
+
+    def _save_game(self, filename: str, player_name: str, deck_count: int) -> Tuple[str, Tuple[int, str, int]]:
+        """
+        Write the game context and its metadata sidecar (runs on the I/O thread).
+
+        Args:
+            filename: Save file name inside the save directory
+            player_name: Player name being saved
+            deck_count: Number of cards in the saved deck
+
+        Returns:
+            Tuple of (filename, metadata cache entry for the written file)
+        """
+        filepath = os.path.join(self.save_dir, filename)
+        self.context.save(filepath)
+        mtime = os.stat(filepath).st_mtime_ns
+        try:
+            self._write_save_meta(filepath, mtime, player_name, deck_count)
+        except OSError:
+            # The sidecar is only an optimization, the save itself succeeded
+            pass
+        return filename, (mtime, player_name, deck_count)
+
+    def _record_saved_file(self, filename: str, meta: Tuple[int, str, int]) -> None:
+        """
+        Update the save list and metadata cache for a file we just wrote.
+
+        The next scan then finds a matching cache entry and does not read the
+        file again, while files added by other means are still picked up.
+
+        Args:
+            filename: Save file name inside the save directory
+            meta: Metadata cache entry (mtime_ns, player_name, deck_count)
+        """
+        self._meta_cache[filename] = meta
+        entry = (filename, meta[1], meta[2])
+        for i, (existing, _, _) in enumerate(self.save_files):
+            if existing == filename:
+                self.save_files[i] = entry
+                break
+        else:
+            self.save_files.append(entry)
+        self._invalidate_options()
+
+    def _start_io(self, operation: str, fn, *args) -> None:
+        """
+        Run a save or load on the I/O thread.
+
+        Args:
+            operation: "save" or "load", used to report the result
+            fn: Callable doing the file I/O
+            *args: Arguments for fn
+        """
+        self._pending_operation = operation
+        self._pending_future = self._io_executor.submit(fn, *args)
+        self.message = "Saving..." if operation == "save" else "Loading..."
+        self.message_timer = 2.0
+
+    def _finish_io(self) -> None:
+        """Report the result of a completed save or load."""
+        future = self._pending_future
+        operation = self._pending_operation
+        self._pending_future = None
+        self._pending_operation = None
+
+        error = future.exception()
+        if operation == "save":
+            if error is None:
+                self._record_saved_file(*future.result())
+                self.message = "Game saved successfully!"
+            else:
+                self.message = f"Save failed: {error}"
+        else:
+            if error is None:
+                self.message = "Game loaded successfully!"
+                self.mode = "menu"
+                self.selected_index = 0
+                self._invalidate_options()
+            else:
+                self.message = f"Load failed: {error}"
+        self.message_timer = 2.0
+
+    def close(self) -> None:
+        """Wait for any pending save or load and stop the I/O threads."""
+        self._io_executor.shutdown(wait=True)
+        if self._meta_executor is not None:
+            self._meta_executor.shutdown(wait=True)
+            self._meta_executor = None
+
+    def _read_changed_save_metas(self, changed: List[Tuple[str, str, int]]) -> None:
+        """
+        Read metadata for new or modified save files into the metadata cache.
+
+        Larger batches are read in parallel on a reused thread pool, since the
+        reads are independent and mostly wait on disk I/O. Files that can't be
+        read are left out of the cache.
+
+        Args:
+            changed: List of (filename, path, mtime_ns) for files to read
+        """
+        if len(changed) < self.META_PARALLEL_MIN:
+            for filename, path, mtime in changed:
                 try:
-                    with open(filepath, 'rb') as f:
-                        save_data = pickle.load(f)
-                    player_name = save_data.get('player_name', 'Unknown')
-                    deck = save_data.get('player_deck', [])
-                    deck_count = len(deck) if deck else 0
-                    self.save_files.append((filename, player_name, deck_count))
+                    self._meta_cache[filename] = (mtime, *self._read_save_meta(path, mtime))
                 except Exception:
-                    # Skip corrupted save files
+                    # Skip save files that can't be read
                     pass
+            return
+
+        if self._meta_executor is None:
+            self._meta_executor = ThreadPoolExecutor(max_workers=self.META_READ_WORKERS)
+        futures = [(filename, mtime, self._meta_executor.submit(self._read_save_meta, path, mtime))
+                   for filename, path, mtime in changed]
+        for filename, mtime, future in futures:
+            try:
+                self._meta_cache[filename] = (mtime, *future.result())
+            except Exception:
+                # Skip save files that can't be read
+                pass
+
+    def _scan_save_files(self) -> None:
+        """Scan savegames directory and load metadata from each save file."""
+        # scandir entries carry the name, full path and file type, so no
+        # extra joins or stat calls are needed per file. A missing directory
+        # is detected by scandir itself rather than a separate exists() check.
+        found = []  # (filename, path, mtime_ns) in directory order
+        try:
+            with os.scandir(self.save_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.dat') or not entry.is_file(follow_symlinks=False):
+                        continue
+                    try:
+                        found.append((entry.name, entry.path, entry.stat().st_mtime_ns))
+                    except OSError:
+                        # File vanished while scanning
+                        pass
+        except FileNotFoundError:
+            # No save directory, so no saves
+            pass
+
+        # Only files that are new or changed since they were cached are read
+        changed = []
+        for filename, path, mtime in found:
+            cached = self._meta_cache.get(filename)
+            if not cached or cached[0] != mtime:
+                changed.append((filename, path, mtime))
+        if changed:
+            self._read_changed_save_metas(changed)
+
+        self.save_files = []
+        seen = set()
+        for filename, _, mtime in found:
+            seen.add(filename)
+            cached = self._meta_cache.get(filename)
+            if cached and cached[0] == mtime:
+                self.save_files.append((filename, cached[1], cached[2]))
+
+        # Forget files that no longer exist
+        for filename in self._meta_cache.keys() - seen:
+            del self._meta_cache[filename]
+
+        # Option labels built from the old file list are no longer needed
+        self._text_cache.clear()
+        self._invalidate_options()
 
     def _execute_action(self, action: str) -> Optional[str]:
         """
@@ -78,15 +403,9 @@ class SaveManagement:
                 self.message_timer = 2.0
                 return None
             
-            try:
-                filename = f"{self.context.player_name}.dat"
-                filepath = os.path.join(self.save_dir, filename)
-                self.context.save(filepath)
-                self.message = "Game saved successfully!"
-                self.message_timer = 2.0
-            except Exception as e:
-                self.message = f"Save failed: {e}"
-                self.message_timer = 2.0
+            filename = f"{self.context.player_name}.dat"
+            deck_count = len(self.context.player_deck) if self.context.player_deck else 0
+            self._start_io("save", self._save_game, filename, self.context.player_name, deck_count)
         elif action == "load":
             # Switch to load select mode
             self._scan_save_files()
@@ -96,25 +415,19 @@ class SaveManagement:
             else:
                 self.mode = "load_select"
                 self.selected_index = 0
+                self._invalidate_options()
         elif action == "menu":
             return "menu"
         elif action == "back":
             # Return to menu mode from load select
             self.mode = "menu"
             self.selected_index = 0
+            self._invalidate_options()
         elif action.startswith("load_file:"):
             # Load specific save file
             filename = action.split(":", 1)[1]
             filepath = os.path.join(self.save_dir, filename)
-            try:
-                self.context.load(filepath)
-                self.message = "Game loaded successfully!"
-                self.message_timer = 2.0
-                self.mode = "menu"
-                self.selected_index = 0
-            except Exception as e:
-                self.message = f"Load failed: {e}"
-                self.message_timer = 2.0
+            self._start_io("load", self.context.load, filepath)
         return None
 
     def handle_events(self, events: list[pygame.event.Event]) -> Optional[str]:
@@ -127,15 +440,15 @@ class SaveManagement:
         Returns:
             Action string for state transitions or None
         """
-        # Get current menu options based on mode
-        if self.mode == "load_select":
-            current_options = [(f"{name} ({count} cards)", f"load_file:{filename}") 
-                             for filename, name, count in self.save_files]
-            current_options.append(("Back", "back"))
-        else:
-            current_options = self.menu_options
+        # Options for the current mode, rebuilt only when the mode or file list changes
+        current_options = self._current_options()
 
         for event in events:
+            # Ignore input until a pending save or load has finished, including
+            # the rest of the batch that started it
+            if self._pending_future is not None:
+                return None
+
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     if self.mouse_over_menu_item:
@@ -178,11 +491,44 @@ class SaveManagement:
         Args:
             dt: Delta time in seconds
         """
+        if self._pending_future is not None:
+            # Keep the "Saving..."/"Loading..." message up until the I/O is done
+            if self._pending_future.done():
+                self._finish_io()
+            return
+
         if self.message_timer > 0:
             self.message_timer -= dt
 
+    def invalidate(self) -> None:
+        """Force the next render to repaint even if nothing changed."""
+        self._last_render_key = None
+
     def render(self) -> None:
         """Render the save management screen."""
+        screen_width, screen_height = self.screen.get_size()
+        center_x = screen_width // 2
+
+        # Mouse position
+        mouse_pos = pygame.mouse.get_pos()
+
+        # Skip the repaint when nothing visible has changed since the last frame
+        deck_count = len(self.context.player_deck) if self.context.player_deck else 0
+        render_key = (
+            self.mode,
+            self.selected_index,
+            self.message if self.message_timer > 0 else None,
+            mouse_pos,
+            self.context.player_name,
+            deck_count,
+            self._options_version,
+            screen_width,
+            screen_height
+        )
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
         # Dark brown background
         self.screen.fill((64, 48, 32))
 
@@ -192,62 +538,44 @@ class SaveManagement:
         else:
             title_text = "Save Management"
         
-        title_surface = self.font.render(title_text, True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 100))
+        title_surface = self._render_text(self.font, title_text, (255, 255, 255))
+        title_rect = title_surface.get_rect(center=(center_x, 100))
         self.screen.blit(title_surface, title_rect)
 
         # Current player info (only in menu mode)
         y_offset = 200
         if self.mode == "menu":
             if self.context.player_name:
-                player_surface = self.font_small.render(f"Player: {self.context.player_name}", True, (200, 200, 200))
-                player_rect = player_surface.get_rect(center=(self.screen.get_width() // 2, y_offset))
+                player_surface = self._render_text(self.font_small, f"Player: {self.context.player_name}", (200, 200, 200))
+                player_rect = player_surface.get_rect(center=(center_x, y_offset))
                 self.screen.blit(player_surface, player_rect)
 
-                deck_count = len(self.context.player_deck) if self.context.player_deck else 0
-                deck_surface = self.font_small.render(f"Deck: {deck_count} cards", True, (200, 200, 200))
-                deck_rect = deck_surface.get_rect(center=(self.screen.get_width() // 2, y_offset + 50))
+                deck_surface = self._render_text(self.font_small, f"Deck: {deck_count} cards", (200, 200, 200))
+                deck_rect = deck_surface.get_rect(center=(center_x, y_offset + 50))
                 self.screen.blit(deck_surface, deck_rect)
                 y_offset = 350
             else:
-                no_game_surface = self.font_small.render("No active game", True, (150, 150, 150))
-                no_game_rect = no_game_surface.get_rect(center=(self.screen.get_width() // 2, y_offset))
+                no_game_surface = self._render_text(self.font_small, "No active game", (150, 150, 150))
+                no_game_rect = no_game_surface.get_rect(center=(center_x, y_offset))
                 self.screen.blit(no_game_surface, no_game_rect)
                 y_offset = 300
         else:
             y_offset = 200
 
-        # Mouse position
-        mouse_pos = pygame.mouse.get_pos()
+        # Option layout only changes with the options, start position or screen width
+        if self._layout_key != (y_offset, screen_width):
+            self._rebuild_layout(y_offset, screen_width)
 
-        # Get current menu options based on mode
-        if self.mode == "load_select":
-            current_options = [(f"{name} ({count} cards)", f"load_file:{filename}") 
-                             for filename, name, count in self.save_files]
-            current_options.append(("Back", "back"))
-        else:
-            current_options = self.menu_options
-
-        # Menu options with rectangles
-        rect_width = 400
-        rect_height = 60
-        gap = 20
+        # Options share one column, so the horizontal hit test is done once and
+        # each option only compares the mouse y against its precomputed span
+        mouse_x, mouse_y = mouse_pos
+        left_x, right_x = self._layout_x_range
+        mouse_in_column = left_x <= mouse_x < right_x
 
         anyrect = False
-        for i, (option_text, _) in enumerate(current_options):
-            option_surface = self.font_small.render(option_text, True, (255, 255, 255))
-            option_rect = option_surface.get_rect(center=(self.screen.get_width() // 2, y_offset))
-
-            # Create fixed-width rectangle centered on screen
-            bg_rect = pygame.Rect(
-                self.screen.get_width() // 2 - rect_width // 2,
-                y_offset - rect_height // 2,
-                rect_width,
-                rect_height
-            )
-
+        for i, (bg_rect, option_rect, option_surface, top, bottom) in enumerate(self._layout):
             # Check if mouse is hovering over menu rectangles and update selection
-            if bg_rect.collidepoint(mouse_pos):
+            if mouse_in_column and top <= mouse_y < bottom:
                 self.selected_index = i
                 anyrect = True
 
@@ -257,12 +585,11 @@ class SaveManagement:
             pygame.draw.rect(self.screen, color, bg_rect)
 
             self.screen.blit(option_surface, option_rect)
-            y_offset += rect_height + gap
 
         self.mouse_over_menu_item = anyrect
 
         # Message
         if self.message_timer > 0:
-            message_surface = self.font_small.render(self.message, True, (255, 255, 100))
-            message_rect = message_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 100))
+            message_surface = self._render_text(self.font_small, self.message, (255, 255, 100))
+            message_rect = message_surface.get_rect(center=(center_x, screen_height - 100))
             self.screen.blit(message_surface, message_rect)
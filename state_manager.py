@@ -6,20 +6,21 @@ using a state machine pattern. Each state inherits from GameState and implements
 interface for event handling, updates, and rendering.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Optional, Any, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, Any, Union, TYPE_CHECKING
 import pickle
 import pygame
+from shared.fonts import get_font
 
 if TYPE_CHECKING:
     from game_context import GameContext   
 
-class GameState(ABC):
+class GameState:
     """
-    Abstract base class for all game states.
+    Base class for all game states.
 
     States represent different screens or modes in the game (menu, combat, visual novel, etc).
     Each state handles its own events, updates, and rendering independently.
+    Subclasses must override handle_events, update, and render.
     """
 
     def __init__(self, game_context: 'GameContext', state_manager: 'StateManager'):
@@ -33,7 +34,6 @@ class GameState(ABC):
         self.context = game_context
         self.state_manager = state_manager
 
-    @abstractmethod
     def handle_events(self, events: list[pygame.event.Event]) -> None:
         """
         Process input events for this state.
@@ -41,9 +41,8 @@ class GameState(ABC):
         Args:
             events: List of pygame events to process
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def update(self, dt: float) -> None:
         """
         Update state logic.
@@ -51,17 +50,20 @@ class GameState(ABC):
         Args:
             dt: Delta time in seconds since last frame
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def render(self, screen: pygame.Surface) -> None:
+    def render(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
         """
         Render this state to the screen.
 
         Args:
             screen: Pygame surface to render to
+
+        Returns:
+            None if the whole screen may have changed, otherwise the list of
+            changed screen areas
         """
-        pass
+        raise NotImplementedError
 
     def enter(self, **kwargs) -> None:
         """
@@ -82,6 +84,27 @@ class GameState(ABC):
         """
         pass
 
+    def wants_redraw(self) -> bool:
+        """
+        Check whether this state needs to be rendered this frame.
+
+        Override in static screens to skip render() and the display flip
+        while nothing has changed.
+
+        Returns:
+            True if the state should be rendered and presented
+        """
+        return True
+
+    def invalidate(self) -> None:
+        """
+        Called when something else drew over the screen.
+
+        Override in states that skip or limit repaints so the next render
+        repaints everything.
+        """
+        pass
+
     def get_save_data(self) -> Dict[str, Any]:
         """
         Return state data for save file persistence.
@@ -122,27 +145,52 @@ class StateManager:
         self.screen = screen
         self.context = game_context
         self.states: Dict[str, GameState] = {}
+
+        # Factories for states registered lazily; each is called on the first
+        # change_state() to its name and the result moves into self.states
+        self._state_factories: Dict[str, Callable[[], GameState]] = {}
         self.current_state: Optional[GameState] = None
         self.current_state_name: Optional[str] = None
 
+        # Bound methods of the current state, cached on state change so the
+        # per-frame delegation skips the attribute lookups
+        self._cur_handle_events: Optional[Callable[[list[pygame.event.Event]], None]] = None
+        self._cur_update: Optional[Callable[[float], None]] = None
+        self._cur_render: Optional[Callable[[pygame.Surface], Optional[List[pygame.Rect]]]] = None
+        self._cur_wants_redraw: Optional[Callable[[], bool]] = None
+
         # Debug mode settings
         self.debug_mode = debug_mode
         self.context.debug_mode = debug_mode  # Share debug mode with all states via context
         self.error_message: Optional[str] = None
         self.error_timer: float = 0.0
 
+        # Debug error overlay pieces, reused while the same error is showing
+        self._err_overlay: Optional[pygame.Surface] = None
+        self._err_text: Optional[pygame.Surface] = None
+        self._err_text_message: Optional[str] = None
+
         # Register "quit"
         self.register_state("quit", None)
 
-    def register_state(self, name: str, state: GameState) -> None:
+    def register_state(self, name: str, state: Union[GameState, Callable[[], GameState], None]) -> None:
         """
         Register a state with the manager.
 
+        Passing a factory instead of an instance defers creating the state
+        (and importing its engine, if the factory imports lazily) until the
+        state is first entered.
+
         Args:
             name: Identifier for this state (e.g., "menu", "combat")
-            state: GameState instance to register
+            state: GameState instance, or a no-argument callable returning one
         """
-        self.states[name] = state
+        if callable(state) and not isinstance(state, GameState):
+            self.states.pop(name, None)
+            self._state_factories[name] = state
+        else:
+            self._state_factories.pop(name, None)
+            self.states[name] = state
 
     def change_state(self, name: str, **kwargs) -> None:
         """
@@ -157,10 +205,16 @@ class StateManager:
         if self.debug_mode:
             print(f"Switching to {name} with kwargs: {kwargs}")
         if name not in self.states:
-            # Show error in debug mode
-            self.error_message = f"Invalid state: '{name}'"
-            self.error_timer = 1.0
-            return
+            factory = self._state_factories.get(name)
+            if factory is None:
+                # Show error in debug mode
+                self.error_message = f"Invalid state: '{name}'"
+                self.error_timer = 1.0
+                return
+            # First visit to a lazily registered state; the factory is kept
+            # until construction succeeds so a failure can be retried
+            self.states[name] = factory()
+            del self._state_factories[name]
 
         # Exit current state
         if self.current_state:
@@ -180,6 +234,10 @@ class StateManager:
         # Otherwise switch to new state
         self.current_state = self.states[name]
         self.current_state_name = name
+        self._cur_handle_events = self.current_state.handle_events
+        self._cur_update = self.current_state.update
+        self._cur_render = self.current_state.render
+        self._cur_wants_redraw = self.current_state.wants_redraw
         self.current_state.enter(**kwargs)
 
     def handle_events(self, events: list[pygame.event.Event]) -> None:
@@ -189,8 +247,9 @@ class StateManager:
         Args:
             events: List of pygame events
         """
-        if self.current_state:
-            self.current_state.handle_events(events)
+        handle_events = self._cur_handle_events
+        if handle_events is not None:
+            handle_events(events)
 
     def update(self, dt: float) -> None:
         """
@@ -199,34 +258,73 @@ class StateManager:
         Args:
             dt: Delta time in seconds
         """
-        if self.current_state:
-            self.current_state.update(dt)
+        update = self._cur_update
+        if update is not None:
+            update(dt)
 
         # Update error timer
         if self.error_timer > 0:
             self.error_timer -= dt
+            if self.error_timer <= 0:
+                # Error is gone, free the overlay pieces and have the state
+                # paint over what the overlay left on screen
+                self._err_overlay = None
+                self._err_text = None
+                self._err_text_message = None
+                if self.current_state:
+                    self.current_state.invalidate()
+
+    def wants_redraw(self) -> bool:
+        """
+        Check whether the current frame needs to be rendered and presented.
 
-    def render(self, screen: pygame.Surface) -> None:
+        Returns:
+            True if the current state asks for a redraw or the debug error
+            overlay is showing
+        """
+        if self.debug_mode and self.error_message and self.error_timer > 0:
+            return True
+        wants_redraw = self._cur_wants_redraw
+        if wants_redraw is not None:
+            return wants_redraw()
+        return True
+
+    def render(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
         """
         Delegate rendering to the current state.
 
         Args:
             screen: Pygame surface to render to
+
+        Returns:
+            None if the whole screen should be presented, otherwise the list
+            of changed screen areas to update
         """
-        if self.current_state:
-            self.current_state.render(screen)
+        show_error = self.debug_mode and self.error_message and self.error_timer > 0
+        if show_error and self.current_state:
+            # The overlay is translucent, so the state must repaint underneath it
+            self.current_state.invalidate()
+
+        dirty = None
+        render = self._cur_render
+        if render is not None:
+            dirty = render(screen)
 
         # Render debug error overlay
-        if self.debug_mode and self.error_message and self.error_timer > 0:
+        if show_error:
             # Semi-transparent dark overlay
-            overlay = pygame.Surface(screen.get_size())
-            overlay.set_alpha(200)
-            overlay.fill((0, 0, 0))
-            screen.blit(overlay, (0, 0))
+            if self._err_overlay is None or self._err_overlay.get_size() != screen.get_size():
+                self._err_overlay = pygame.Surface(screen.get_size())
+                self._err_overlay.set_alpha(200)
+                self._err_overlay.fill((0, 0, 0))
+            screen.blit(self._err_overlay, (0, 0))
 
             # Error message box
-            font = pygame.font.Font(None, 48)
-            text = font.render(self.error_message, True, (255, 50, 50))
+            if self._err_text is None or self._err_text_message != self.error_message:
+                font = get_font(48)
+                self._err_text = font.render(self.error_message, True, (255, 50, 50))
+                self._err_text_message = self.error_message
+            text = self._err_text
             text_rect = text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
 
             # Background for text
@@ -237,3 +335,6 @@ class StateManager:
 
             # Draw text
             screen.blit(text, text_rect)
+            return None
+
+        return dirty
@@ -0,0 +1,114 @@
+"""Generic state that delegates to a game engine."""
+
+import pygame
+from typing import Any
+from game_context import GameContext
+from state_manager import GameState, StateManager
+
+
+class EngineDelegateState(GameState):
+    """
+    State wrapper that forwards the state protocol to an engine.
+
+    An engine is created by create_engine() when the state is entered and
+    dropped when it exits. Engines implement handle_events (returning an
+    optional state transition), update and render(); close() and
+    wants_redraw() are optional.
+    """
+
+    def __init__(self, game_context: GameContext, state_manager: StateManager):
+        """
+        Initialize the engine state.
+
+        Args:
+            game_context: Shared game state
+            state_manager: Reference to StateManager for state transitions
+        """
+        super().__init__(game_context, state_manager)
+        self.engine = None
+
+    def create_engine(self, **kwargs) -> Any:
+        """
+        Create the engine for this state.
+
+        Args:
+            **kwargs: Data passed from the previous state
+
+        Returns:
+            New engine instance
+        """
+        raise NotImplementedError
+
+    def enter(self, **kwargs) -> None:
+        """
+        Called when entering this state; instantiates the engine.
+
+        Args:
+            **kwargs: Data passed from the previous state
+        """
+        self.engine = self.create_engine(**kwargs)
+
+    def exit(self) -> None:
+        """
+        Called when exiting this state; closes and drops the engine.
+        """
+        engine = self.engine
+        self.engine = None
+        close = getattr(engine, 'close', None)
+        if close is not None:
+            close()
+
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
+        """
+        Delegate event handling to the engine and handle state transitions.
+
+        Args:
+            events: List of pygame events
+        """
+        engine = self.engine
+        if engine is not None:
+            action = engine.handle_events(events)
+            if action:
+                self.state_manager.change_state(action)
+
+    def update(self, dt: float) -> None:
+        """
+        Delegate update to the engine.
+
+        Args:
+            dt: Delta time in seconds
+        """
+        engine = self.engine
+        if engine is not None:
+            engine.update(dt)
+
+    def render(self, screen: pygame.Surface) -> None:
+        """
+        Delegate rendering to the engine.
+
+        Args:
+            screen: Pygame surface to render to
+        """
+        engine = self.engine
+        if engine is not None:
+            engine.render()
+
+    def invalidate(self) -> None:
+        """
+        Tell the engine its last frame was drawn over, if it caches frames.
+        """
+        invalidate = getattr(self.engine, 'invalidate', None)
+        if invalidate is not None:
+            invalidate()
+
+    def wants_redraw(self) -> bool:
+        """
+        Ask the engine whether anything changed since the last render.
+
+        Returns:
+            True if the screen should be redrawn this frame
+        """
+        wants_redraw = getattr(self.engine, 'wants_redraw', None)
+        if wants_redraw is not None:
+            return wants_redraw()
+        return True
@@ -1,8 +1,37 @@
 """Main menu state with number key navigation."""
 
 import pygame
+from typing import Dict, List, Optional, Tuple
 from game_context import GameContext
 from state_manager import GameState, StateManager
+from shared.fonts import get_font
+
+
+# Main menu options as (label, target state), in display order
+MENU_OPTIONS = (
+    ( "1 - Play Card Combat Demo", "card_combat" ),
+    ( "2 - Card Registry", "card_registry" ),
+    ( "3 - Deck Builder", "deck_builder" ),
+    ( "4 - Save Management", "load_game" ),
+    ( "ESC - Quit", "quit" )
+)
+
+
+def _to_display_format(surface: pygame.Surface, alpha: bool = False) -> pygame.Surface:
+    """
+    Convert a surface to the display's pixel format so blits need no conversion.
+
+    Args:
+        surface: Surface to convert
+        alpha: Keep per-pixel alpha (for text) instead of converting to opaque
+
+    Returns:
+        Converted surface, or the original if no display mode is set yet
+    """
+    try:
+        return surface.convert_alpha() if alpha else surface.convert()
+    except pygame.error:
+        return surface
 
 
 class MenuState(GameState):
@@ -13,6 +42,12 @@ class MenuState(GameState):
     transition to the corresponding state, ESC quits the game.
     """
 
+    # Menu option rectangle size, vertical gap between options and first option y
+    OPTION_WIDTH = 400
+    OPTION_HEIGHT = 60
+    OPTION_GAP = 20
+    OPTIONS_START_Y = 250
+
     def __init__(self, game_context: GameContext, state_manager: StateManager):
         """
         Initialize menu state.
@@ -22,21 +57,52 @@ class MenuState(GameState):
             state_manager: Reference to StateManager for state transitions
         """
         super().__init__(game_context, state_manager)
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 36)
+        self.font_large = get_font(72)
+        self.font_medium = get_font(36)
         self.selected_index = 0  # Track which menu item is selected
         self.mouse_over_menu_item = False
         self.game_context = game_context
         self.state_manager = state_manager
 
-        self.menu_options = [
-            ( "1 - Play Card Combat Demo", "card_combat" ),
-            ( "2 - Card Registry", "card_registry" ),
-            ( "3 - Deck Builder", "deck_builder" ),
-            ( "4 - Save Management", "load_game" ),
-            ( "ESC - Quit", "quit" )
+        # Option labels and the states they lead to, as parallel tuples
+        self._option_labels, self._option_targets = zip(*MENU_OPTIONS)
+        self._n_options = len(MENU_OPTIONS)
+
+        # Number keys 1-9 lead straight to the matching option's state
+        self._numkey_to_target: Dict[int, str] = {
+            getattr(pygame, f"K_{i + 1}"): target
+            for i, target in enumerate(self._option_targets[:9])
+        }
+
+        # Menu text never changes, so render it once instead of every frame
+        self._title_surface = _to_display_format(
+            self.font_large.render("Main Menu", True, (255, 255, 255)), alpha=True)
+        self._option_surfaces = [
+            _to_display_format(self.font_medium.render(label, True, (255, 255, 255)), alpha=True)
+            for label in self._option_labels
+        ]
+
+        # Each option composed once with its background as (normal, selected),
+        # or None for empty labels which have no background
+        self._option_frames: List[Optional[Tuple[pygame.Surface, pygame.Surface]]] = [
+            self._compose_option(label, option_surface)
+            for label, option_surface in zip(self._option_labels, self._option_surfaces)
         ]
 
+        # Title rect and per-option (bg_rect, text_rect), valid for _layout_size
+        self._title_rect: Optional[pygame.Rect] = None
+        self._layout: List[Tuple[Optional[pygame.Rect], pygame.Rect]] = []
+        self._layout_size: Optional[Tuple[int, int]] = None
+
+        # Screen size and selection of the last paint; render() repaints in
+        # full when the size doesn't match and otherwise only changed options
+        self._painted_size: Optional[Tuple[int, int]] = None
+        self._painted_index = self.selected_index
+
+        # Set whenever the menu needs rendering: on creation, selection
+        # changes, resizes and invalidation; cleared by render()
+        self._dirty = True
+
     def handle_events(self, events: list[pygame.event.Event]) -> None:
         """
         Handle menu input events.
@@ -46,35 +112,59 @@ class MenuState(GameState):
         Args:
             events: List of pygame events
         """
+        previous_index = self.selected_index
+
         for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                match event.button:
-                    case 1:  # Left click
-                        if self.mouse_over_menu_item:
-                            self._change_state( self.menu_options[self.selected_index][1] )
-
-            if event.type == pygame.KEYDOWN:
-                match event.key:
-                    case pygame.K_1 | pygame.K_2 | pygame.K_3 | pygame.K_4 | pygame.K_5 | pygame.K_6:
-                        menu_item = event.key - pygame.K_0 - 1
-                        if menu_item < len(self.menu_options):
-                            self._change_state( self.menu_options[menu_item][1] )
-                    case pygame.K_UP:
-                        self.selected_index -= 1
-                        if self.selected_index < 0:
-                            self.selected_index = len(self.menu_options) - 1
-                        if self.selected_index >= len(self.menu_options):
-                            self.selected_index = 0
-                    case pygame.K_DOWN:
-                        self.selected_index += 1
-                        if self.selected_index < 0:
-                            self.selected_index = len(self.menu_options) - 1
-                        if self.selected_index >= len(self.menu_options):
-                            self.selected_index = 0
-                    case pygame.K_RETURN:
-                        self._change_state( self.menu_options[self.selected_index][1] ) 
-                    case pygame.K_ESCAPE:
-                        self._change_state( "quit" )
+            match event.type:
+                case pygame.VIDEORESIZE:
+                    self._dirty = True
+
+                case pygame.MOUSEMOTION:
+                    # Hover only changes when the cursor moves
+                    self._update_hover(event.pos)
+
+                case pygame.MOUSEBUTTONDOWN:
+                    match event.button:
+                        case 1:  # Left click
+                            # Hover may be stale, e.g. after returning from another state
+                            self._update_hover(event.pos)
+                            if self.mouse_over_menu_item:
+                                self._change_state( self._option_targets[self.selected_index] )
+
+                case pygame.KEYDOWN:
+                    # Number keys 1-9 pick the matching option directly
+                    target = self._numkey_to_target.get(event.key)
+                    if target is not None:
+                        self._change_state( target )
+                        continue
+
+                    match event.key:
+                        case pygame.K_UP:
+                            self.selected_index = (self.selected_index - 1) % self._n_options
+                        case pygame.K_DOWN:
+                            self.selected_index = (self.selected_index + 1) % self._n_options
+                        case pygame.K_RETURN:
+                            self._change_state( self._option_targets[self.selected_index] ) 
+                        case pygame.K_ESCAPE:
+                            self._change_state( "quit" )
+
+        # Only a selection change alters what the menu shows
+        if self.selected_index != previous_index:
+            self._dirty = True
+
+    def _update_hover(self, mouse_pos: Tuple[int, int]) -> None:
+        """
+        Select the option under the mouse cursor, if any.
+
+        Args:
+            mouse_pos: Mouse position in screen coordinates
+        """
+        anyrect = False
+        for i, (bg_rect, _) in enumerate(self._layout):
+            if bg_rect is not None and bg_rect.collidepoint(mouse_pos):
+                self.selected_index = i
+                anyrect = True
+        self.mouse_over_menu_item = anyrect
 
     def _change_state(self, state_name: str) -> None:
         """
@@ -91,6 +181,55 @@ class MenuState(GameState):
         else:
             self.state_manager.change_state(state_name)
 
+    def _compose_option(self, label: str, text_surface: pygame.Surface) -> Optional[Tuple[pygame.Surface, pygame.Surface]]:
+        """
+        Compose an option's text onto its normal and selected backgrounds.
+
+        Args:
+            label: Option label
+            text_surface: Pre-rendered label text
+
+        Returns:
+            Tuple of (normal, selected) surfaces, or None for an empty label
+        """
+        if not label:
+            return None
+
+        frames = []
+        for color in ((64, 64, 64), (100, 100, 150)):
+            frame = pygame.Surface((self.OPTION_WIDTH, self.OPTION_HEIGHT))
+            frame.fill(color)
+            frame.blit(text_surface, text_surface.get_rect(center=(self.OPTION_WIDTH // 2, self.OPTION_HEIGHT // 2)))
+            frames.append(_to_display_format(frame))
+        return frames[0], frames[1]
+
+    def _rebuild_layout(self, size: Tuple[int, int]) -> None:
+        """
+        Precompute title and option rectangles for a screen size.
+
+        Args:
+            size: Screen (width, height) the menu is centered on
+        """
+        center_x = size[0] // 2
+        self._title_rect = self._title_surface.get_rect(center=(center_x, 100))
+
+        self._layout = []
+        y_offset = self.OPTIONS_START_Y
+        for label, option_surface in zip(self._option_labels, self._option_surfaces):
+            text_rect = option_surface.get_rect(center=(center_x, y_offset))
+            bg_rect = None
+            if label:  # No rectangle for empty strings
+                # Fixed-width rectangle centered on screen
+                bg_rect = pygame.Rect(
+                    center_x - self.OPTION_WIDTH // 2,
+                    y_offset - self.OPTION_HEIGHT // 2,
+                    self.OPTION_WIDTH,
+                    self.OPTION_HEIGHT
+                )
+            self._layout.append((bg_rect, text_rect))
+            y_offset += self.OPTION_HEIGHT + self.OPTION_GAP
+        self._layout_size = size
+
     def update(self, dt: float) -> None:
         """
         Update menu state.
@@ -100,62 +239,100 @@ class MenuState(GameState):
         """
         pass
 
-    def render(self, screen: pygame.Surface) -> None:
+    def enter(self, **kwargs) -> None:
         """
-        Render the main menu.
+        Called when entering the menu; the screen still shows the previous state.
+
+        Args:
+            **kwargs: Optional data passed from previous state
+        """
+        # The mouse moved while another state was active
+        self._update_hover(pygame.mouse.get_pos())
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force the next render to repaint the whole menu."""
+        self._painted_size = None
+        self._dirty = True
+
+    def wants_redraw(self) -> bool:
+        """
+        Check whether the menu changed since the last render.
+
+        Returns:
+            True if render() needs to run this frame
+        """
+        return self._dirty
 
-        Displays title and navigation options on black background.
+    def _option_blit(self, index: int) -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Get the surface and position for a menu option with its selection color.
 
         Args:
-            screen: Pygame surface to render to
+            index: Index of the option to draw
+
+        Returns:
+            (surface, destination) pair for Surface.blits()
+        """
+        bg_rect, text_rect = self._layout[index]
+        frames = self._option_frames[index]
+
+        if frames is None:
+            return self._option_surfaces[index], text_rect
+        # Pre-composed background and text, picked by selection
+        return frames[index == self.selected_index], bg_rect
+
+    def render(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
         """
-        # Black background
-        screen.fill((0, 0, 0))
+        Render the main menu.
 
-        # Title
-        title_surface = self.font_large.render("Main Menu", True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(screen.get_width() // 2, 100))
-        screen.blit(title_surface, title_rect)
+        Displays title and navigation options on black background. After the
+        first full paint only options whose selection changed are redrawn.
 
-        # Mouse
-        mouse_pos = pygame.mouse.get_pos()
+        Args:
+            screen: Pygame surface to render to
 
-        # Menu options
-        options = [option[0] for option in self.menu_options]
+        Returns:
+            None if the whole screen was repainted, otherwise the list of
+            screen areas that changed (empty if nothing did)
+        """
+        # Nothing changed since the last render, the screen still shows it
+        size = screen.get_size()
+        if not self._dirty and size == self._painted_size:
+            return []
+        self._dirty = False
 
-        # Fixed width for all menu rectangles
-        rect_width = 400
-        rect_height = 60
-        gap = 20  # Vertical spacing between menu items
-        padding = 20
+        # Layout only changes with the screen size
+        if size != self._layout_size:
+            self._rebuild_layout(size)
 
-        y_offset = 250
-        anyrect = False
-        for i, option in enumerate(options):
-            option_surface = self.font_medium.render(option, True, (255, 255, 255))
-            option_rect = option_surface.get_rect(center=(screen.get_width() // 2, y_offset))
+        # Full paint on the first frame, after a resize, or when invalidated
+        if self._painted_size != size:
+            # Black background
+            screen.fill((0, 0, 0))
 
-            # Draw background rectangle for menu option
-            if option:  # Skip drawing rectangle for empty strings
-                # Create fixed-width rectangle centered on screen
-                bg_rect = pygame.Rect(
-                    screen.get_width() // 2 - rect_width // 2,
-                    y_offset - rect_height // 2,
-                    rect_width,
-                    rect_height
-                )
+            # Title and every option in one batched blit
+            blit_list = [(self._title_surface, self._title_rect)]
+            blit_list.extend(self._option_blit(i) for i in range(len(self._layout)))
+            screen.blits(blit_list, doreturn=False)
 
-                # Check if mouse is hovering over menu rectangles and update selection
-                if bg_rect.collidepoint(mouse_pos):
-                    self.selected_index = i
-                    anyrect = True
+            self._painted_size = size
+            self._painted_index = self.selected_index
+            return None
 
-                # Use selected_index to determine color
-                is_selected = (i == self.selected_index)
-                color = (100, 100, 150) if is_selected else (64, 64, 64)
-                pygame.draw.rect(screen, color, bg_rect)
+        if self.selected_index == self._painted_index:
+            return []
 
-            screen.blit(option_surface, option_rect)
-            y_offset += rect_height + gap
-    
-        self.mouse_over_menu_item = anyrect 
+        # Only the previously and newly selected options change
+        changed_areas = []
+        blit_list = []
+        for i in (self._painted_index, self.selected_index):
+            if 0 <= i < len(self._layout):
+                bg_rect, text_rect = self._layout[i]
+                area = text_rect if bg_rect is None else bg_rect.union(text_rect)
+                screen.fill((0, 0, 0), area)
+                blit_list.append(self._option_blit(i))
+                changed_areas.append(area)
+        screen.blits(blit_list, doreturn=False)
+        self._painted_index = self.selected_index
+        return changed_areas